@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Request, Response, UploadFile, File, Form
 from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 import httpx
 from contextlib import asynccontextmanager
 import json
@@ -27,7 +28,15 @@ from convert.router import router as convert_router
 from convert.utils.conversion_lookup import get_service_urls
 
 # Import centralized error handling
-from convert.utils.error_handling import create_error_response, ErrorCode, handle_service_error
+from convert.utils.error_handling import (
+    create_error_response,
+    ErrorCode,
+    handle_service_error,
+    http_exception_handler,
+    AppXtracError,
+    app_error_handler
+)
+from convert.utils.orjson_response import ORJSONResponse
 
 # Import centralized HTTP client factory
 from convert.utils.http_client import (
@@ -100,7 +109,11 @@ async def lifespan(app: FastAPI):
         yield
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Render HTTPExceptions through orjson as well
+app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+app.add_exception_handler(AppXtracError, app_error_handler)
 
 # Include the conversion router
 app.include_router(convert_router)
@@ -398,21 +411,21 @@ async def service_ping(service: str, request: Request):
 async def unstructured_to_markdown(request: Request, file: UploadFile = File(...)):
     """Convert document to markdown using Unstructured-IO service and local JSON parsing."""
     if not UNSTRUCTURED_AVAILABLE:
-        return JSONResponse(status_code=503, content={"error": "Unstructured library not available"})
+        raise AppXtracError(ErrorCode.SERVICE_UNAVAILABLE, service="unstructured", details="Unstructured library not available")
 
     try:
-        # Read the uploaded file
-        file_content = await file.read()
-
         # Use centralized unstructured conversion function
         from convert.utils.unstructured_utils import convert_file_with_unstructured_io
         client: httpx.AsyncClient = request.app.state.client
         service_url = SERVICES["unstructured-io"]
         
+        # Stream the spooled upload straight into the request body
+        # instead of reading it into memory first
+        await file.seek(0)
         markdown_content = await convert_file_with_unstructured_io(
             client=client,
             service_url=service_url,
-            file_content=file_content,
+            file_content=file.file,
             filename=file.filename,
             content_type=file.content_type or "application/octet-stream",
             output_format="md",
@@ -437,21 +450,21 @@ async def unstructured_to_markdown(request: Request, file: UploadFile = File(...
 async def unstructured_to_text(request: Request, file: UploadFile = File(...)):
     """Convert document to plain text using Unstructured-IO service and local JSON parsing."""
     if not UNSTRUCTURED_AVAILABLE:
-        return JSONResponse(status_code=503, content={"error": "Unstructured library not available"})
+        raise AppXtracError(ErrorCode.SERVICE_UNAVAILABLE, service="unstructured", details="Unstructured library not available")
 
     try:
-        # Read the uploaded file
-        file_content = await file.read()
-
         # Use centralized unstructured conversion function
         from convert.utils.unstructured_utils import convert_file_with_unstructured_io
         client: httpx.AsyncClient = request.app.state.client
         service_url = SERVICES["unstructured-io"]
         
+        # Stream the spooled upload straight into the request body
+        # instead of reading it into memory first
+        await file.seek(0)
         text_content = await convert_file_with_unstructured_io(
             client=client,
             service_url=service_url,
-            file_content=file_content,
+            file_content=file.file,
             filename=file.filename,
             content_type=file.content_type or "application/octet-stream",
             output_format="txt",
@@ -477,21 +490,21 @@ async def unstructured_to_text(request: Request, file: UploadFile = File(...)):
 async def unstructured_to_html(request: Request, file: UploadFile = File(...)):
     """Convert document to HTML using Unstructured-IO service and local JSON parsing."""
     if not UNSTRUCTURED_AVAILABLE:
-        return JSONResponse(status_code=503, content={"error": "Unstructured library not available"})
+        raise AppXtracError(ErrorCode.SERVICE_UNAVAILABLE, service="unstructured", details="Unstructured library not available")
 
     try:
-        # Read the uploaded file
-        file_content = await file.read()
-
         # Use centralized unstructured conversion function
         from convert.utils.unstructured_utils import convert_file_with_unstructured_io
         client: httpx.AsyncClient = request.app.state.client
         service_url = SERVICES["unstructured-io"]
         
+        # Stream the spooled upload straight into the request body
+        # instead of reading it into memory first
+        await file.seek(0)
         html_content = await convert_file_with_unstructured_io(
             client=client,
             service_url=service_url,
-            file_content=file_content,
+            file_content=file.file,
             filename=file.filename,
             content_type=file.content_type or "application/octet-stream",
             output_format="html",
@@ -517,7 +530,7 @@ async def unstructured_to_html(request: Request, file: UploadFile = File(...)):
 async def libreoffice_to_markdown(request: Request, file: UploadFile = File(...)):
     """Convert document to PDF using LibreOffice, then to markdown using Unstructured-IO."""
     if not UNSTRUCTURED_AVAILABLE:
-        return JSONResponse(status_code=503, content={"error": "Unstructured library not available"})
+        raise AppXtracError(ErrorCode.SERVICE_UNAVAILABLE, service="unstructured", details="Unstructured library not available")
 
     try:
         # Read the uploaded file
@@ -33,6 +33,13 @@ else:
     logger.warning("numbers-parser import failed")
 
 
+def _cell_text(value: Any) -> str:
+    """Render a spreadsheet cell as text, mapping missing values to an empty string."""
+    if value is None or value is pd.NA or value is pd.NaT or value != value:
+        return ''
+    return str(value)
+
+
 class LocalConversionFactory:
     """
     Factory for local document conversions.
@@ -228,10 +235,6 @@ class LocalConversionFactory:
         # First, clean column names
         df.columns = [str(col).strip() for col in df.columns]
 
-        # Convert all data to strings and handle NaN values
-        df = df.fillna('')
-        df = df.astype(str)
-
         # Create markdown table
         markdown_lines = []
 
@@ -241,9 +244,9 @@ class LocalConversionFactory:
         # Separator row
         markdown_lines.append("| " + " | ".join(["---"] * len(df.columns)) + " |")
 
-        # Data rows
-        for _, row in df.iterrows():
-            markdown_lines.append("| " + " | ".join(str(val).replace('|', '\\|') for val in row) + " |")
+        # Data rows - cells are stringified while joining instead of copying the frame
+        for row in df.itertuples(index=False, name=None):
+            markdown_lines.append("| " + " | ".join(_cell_text(val).replace('|', '\\|') for val in row) + " |")
 
         return header + "\n".join(markdown_lines)
 
@@ -268,10 +271,6 @@ class LocalConversionFactory:
         # Clean column names
         df.columns = [str(col).strip() for col in df.columns]
 
-        # Convert all data to strings and handle NaN values
-        df = df.fillna('')
-        df = df.astype(str)
-
         text_lines = []
 
         # Add column headers
@@ -279,8 +278,8 @@ class LocalConversionFactory:
         text_lines.append("-" * 50)
 
         # Add data rows
-        for _, row in df.iterrows():
-            text_lines.append("\t".join(str(val) for val in row))
+        for row in df.itertuples(index=False, name=None):
+            text_lines.append("\t".join(_cell_text(val) for val in row))
 
         return header + "\n".join(text_lines)
 
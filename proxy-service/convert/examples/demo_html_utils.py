@@ -8,16 +8,18 @@ This script shows how to use the process_html_content function with the htmlBody
 import sys
 import os
 
-# Add the parent directories to the path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-sys.path.insert(0, parent_dir)
-
-from utils.html_utils import process_html_content
+__all__ = []
 
 
 def demo_html_processing():
     """Demonstrate HTML processing with different scenarios."""
+    # Make the convert package directory importable only when the demo actually runs
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+
+    from utils.html_utils import process_html_content
 
     print("=== HTML Processing Utility Demo ===\n")
 
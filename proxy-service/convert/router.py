@@ -7,9 +7,10 @@ to the most reliable service for each conversion type.
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Request, Form, Query
 from fastapi.responses import StreamingResponse, JSONResponse
+import asyncio
 import httpx
 import logging
-from typing import Optional
+from typing import List, Optional
 from io import BytesIO
 
 # Import local conversion factory
@@ -63,7 +64,9 @@ from .utils.conversion_chaining import (
 )
 from .utils.conversion_core import (
     _convert_file,
-    _get_service_client
+    _get_service_client,
+    build_batch_archive,
+    convert_batch
 )
 from .utils.conversion_chaining import chain_conversions, ConversionStep
 from .utils.special_handlers import process_presentation_to_html
@@ -127,6 +130,45 @@ async def convert_url_dynamic(request: Request, output_format: str, url: str = F
         output_format=output_format
     )
 
+#-- Batch {input}-{output} conversions
+#-------------------------------------------------------------------------------
+@router.post("/batch/{input_format}-{output_format}")
+async def convert_batch_dynamic(request: Request, input_format: str, output_format: str, files: List[UploadFile] = File(...)):
+    """Convert several files from input_format to output_format and return them as a zip archive"""
+    
+    # Validate format parameters
+    validate_format_parameter(input_format, "input_format", 2, 7)
+    validate_format_parameter(output_format, "output_format", 2, 7)
+    
+    # Check if conversion pair exists in config
+    conversion_methods = get_conversion_methods(input_format, output_format)
+    if not conversion_methods:
+        raise create_http_exception(
+            ErrorCode.CONVERSION_NOT_SUPPORTED,
+            details=f"No conversion available from {input_format} to {output_format}",
+            input_format=input_format,
+            output_format=output_format
+        )
+    
+    # Extract extra parameters from the request, shared by every file
+    form_data = await request.form()
+    extra_params = {}
+    for key, value in form_data.items():
+        # Skip the file parameters
+        if key != 'files':
+            extra_params[key] = value
+    
+    results = await convert_batch(request, files, input_format, output_format, extra_params=extra_params)
+    
+    # Package the converted files together with a manifest describing each result;
+    # DEFLATE is CPU-bound, so it runs in a worker thread rather than on the event loop
+    archive = await asyncio.to_thread(build_batch_archive, results)
+    return StreamingResponse(
+        archive,
+        media_type="application/zip",
+        headers={"Content-Disposition": f"attachment; filename=converted_{output_format}.zip"}
+    )
+
 #-- Consolidated {input}-{output} format converter
 #-------------------------------------------------------------------------------
 @router.post("/{input_format}-{output_format}")
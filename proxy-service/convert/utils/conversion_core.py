@@ -5,20 +5,30 @@ This module contains the main conversion logic, service client management,
 and utility functions that were moved from router.py to keep the router clean.
 """
 
+import asyncio
+import json
 import logging
+import math
+import os
 import httpx
 import re
-from typing import Optional, Dict, Any
+import zipfile
+from functools import lru_cache
+from html import escape as _html_escape
+from types import MappingProxyType
+from typing import Any, BinaryIO, Dict, List, Optional, Union
 from urllib.parse import urlparse
 from io import BytesIO
 from fastapi import HTTPException, Request, UploadFile, Form
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 # Import centralized HTTP client factory
-from .http_client import ServiceType
+from .http_client import ServiceType, get_http_client_factory
 
 # Import local conversion factory
 from .._local_ import LocalConversionFactory
+from .._local_.factory import convert_file_locally
 
 # Import Excel processing libraries (for backwards compatibility)
 try:
@@ -54,6 +64,18 @@ except ImportError:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of files from one batch request converted at the same time
+CONVERT_CONCURRENCY = int(os.getenv("APPLITEXTRAC_CONVERT_CONCURRENCY", "8"))
+_conversion_semaphore = asyncio.Semaphore(CONVERT_CONCURRENCY)
+
+# Limits for one batch request: number of files, and total converted output
+# held in memory while the response archive is built
+BATCH_MAX_FILES = int(os.getenv("APPLITEXTRAC_BATCH_MAX_FILES", "50"))
+BATCH_MAX_BYTES = int(os.getenv("APPLITEXTRAC_BATCH_MAX_BYTES", str(512 * 1024 * 1024)))
+
+# In-memory limit for uploads spooled from bytes before rolling over to disk
+UPLOAD_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
 from ..config import (
     ConversionService,
     PANDOC_FORMAT_MAP,
@@ -71,7 +93,10 @@ from .url_processor import ConversionInput, fetch_url_content
 from .error_handling import create_http_exception, ErrorCode, handle_conversion_error, handle_service_error
 
 # Import unified MIME type detector
-from .mime_detector import get_mime_type as get_unified_mime_type
+from .mime_detector import get_mime_type as get_unified_mime_type, MIME_TYPE_MAPPINGS
+
+# Read-only format -> MIME type table for the response path
+FORMAT_MIME_TYPES = MappingProxyType(dict(MIME_TYPE_MAPPINGS))
 
 # Import centralized temp file manager
 from .temp_file_manager import (
@@ -112,6 +137,34 @@ async def _get_service_client(service: ConversionService, request: Request) -> h
         return request.app.state.client
 
 
+async def _post_streaming(client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+    """
+    Send a POST request without buffering the response body.
+
+    The caller owns the returned response and must either consume it
+    (``aread``/``aiter_bytes``) or close it with ``aclose``.
+    """
+    upstream_request = client.build_request("POST", url, **kwargs)
+    return await client.send(upstream_request, stream=True)
+
+
+async def _upload_body(upload: Any) -> Union[BinaryIO, bytes]:
+    """
+    Get an upload's content in a form httpx can send as a multipart file.
+
+    UploadFile (and the wrappers that mimic it) already keep the content in a
+    file object, so that object is rewound and handed over as-is; httpx reads
+    it in chunks. Copying it into another spool would only add I/O, since
+    httpx calls fileno() to size the part, which rolls a spool to disk anyway.
+    Objects without a ``file`` attribute are read into bytes.
+    """
+    await upload.seek(0)
+    file_obj = getattr(upload, "file", None)
+    if file_obj is not None:
+        return file_obj
+    return await upload.read()
+
+
 async def _convert_file(
     request: Request,
     file: Optional[UploadFile] = None,
@@ -169,15 +222,7 @@ async def _convert_file(
             fetch_result = await fetch_url_content(url_input.url)
             
             # Determine content type
-            content_type_map = {
-                "html": "text/html",
-                "json": "application/json", 
-                "txt": "text/plain",
-                "md": "text/markdown",
-                "pdf": "application/pdf",
-                "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            }
-            content_type = content_type_map.get(output_format, "application/octet-stream")
+            content_type = FORMAT_MIME_TYPES.get(output_format, "application/octet-stream")
             
             # Return the content directly as a streaming response
             content_bytes = fetch_result['content']
@@ -191,7 +236,7 @@ async def _convert_file(
             )
             
         except Exception as e:
-            logger.error(f"Failed to fetch URL content for passthrough conversion: {e}")
+            logger.error("Failed to fetch URL content for passthrough conversion: %s", e)
             raise create_http_exception(
                 ErrorCode.URL_FETCH_FAILED,
                 details=f"Failed to fetch URL content: {str(e)}"
@@ -283,9 +328,10 @@ async def _convert_file(
                                     )
                                     
                                     # Extract content from intermediate result
-                                    intermediate_content = b""
+                                    chunks = []
                                     async for chunk in intermediate_result.body_iterator:
-                                        intermediate_content += chunk
+                                        chunks.append(chunk)
+                                    intermediate_content = b"".join(chunks)
                                     
                                     # Call special handler with intermediate content
                                     return await process_presentation_to_html(
@@ -297,7 +343,7 @@ async def _convert_file(
                                         request, file_content, input_format, output_format, special_config
                                     )
                         else:
-                            logger.error(f"Unknown special handler: {handler_name}")
+                            logger.error("Unknown special handler: %s", handler_name)
                             raise HTTPException(status_code=500, detail=f"Unknown special handler: {handler_name}")
                     else:
                         # Regular step with extra config but no special handler
@@ -310,15 +356,7 @@ async def _convert_file(
                         ))
             
             # Determine content type
-            content_type_map = {
-                "md": "text/markdown",
-                "html": "text/html",
-                "json": "application/json",
-                "txt": "text/plain",
-                "pdf": "application/pdf",
-                "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            }
-            final_content_type = content_type_map.get(output_format, "application/octet-stream")
+            final_content_type = FORMAT_MIME_TYPES.get(output_format, "application/octet-stream")
             
             # Execute chained conversion
             return await chain_conversions(
@@ -331,7 +369,7 @@ async def _convert_file(
             )
             
         except Exception as e:
-            logger.error(f"Error in chained conversion {input_format}→{output_format}: {e}")
+            logger.error("Error in chained conversion %s→%s: %s", input_format, output_format, e)
             raise HTTPException(status_code=500, detail=f"Chained conversion failed: {str(e)}")
     
     # For simple conversions, try services in order until one succeeds
@@ -353,8 +391,9 @@ async def _convert_file(
     # Try each service in order
     last_error = None
     for service_to_try, service_desc in available_services:
+        upload_body = None
         try:
-            logger.info(f"Trying service {service_to_try.value} for {input_format}→{output_format}")
+            logger.info("Trying service %s for %s→%s", service_to_try.value, input_format, output_format)
             
             # Get input for this service
             current_file = file
@@ -377,7 +416,7 @@ async def _convert_file(
                             import os
                         
                 except Exception as e:
-                    logger.error(f"Failed to get input for service {service_to_try}: {e}")
+                    logger.error("Failed to get input for service %s: %s", service_to_try, e)
                     raise
             elif url:
                 # Legacy URL handling - should have been converted to url_input above
@@ -392,13 +431,12 @@ async def _convert_file(
             if service_to_try == ConversionService.UNSTRUCTURED_IO:
                 # Unstructured IO supports both files and URLs through the new system
                 if current_file:
-                    # Read file content
-                    await current_file.seek(0)  # Reset file pointer
-                    file_content = await current_file.read()
+                    # Stream the upload's own file object
+                    upload_body = await _upload_body(current_file)
                     
                     # Get MIME type for input file using standard library
                     mime_type = get_mime_type(input_format)
-                    files = {"files": (current_file.filename, BytesIO(file_content), mime_type)}
+                    files = {"files": (current_file.filename, upload_body, mime_type)}
                     # Map output_format to MIME types for Unstructured-IO
                     unstructured_output_format = UNSTRUCTURED_IO_MIME_MAPPING.get(output_format, output_format)
                     
@@ -446,7 +484,7 @@ async def _convert_file(
                         )
 
                     if response.status_code != 200:
-                        logger.error(f"Service {service_to_try} returned {response.status_code}: {response.text}")
+                        logger.error("Service %s returned %s: %s", service_to_try, response.status_code, response.text)
                         raise create_http_exception(
                             ErrorCode.SERVICE_ERROR,
                             details=f"Conversion failed: {response.text}",
@@ -487,13 +525,15 @@ async def _convert_file(
                 else:
                     # For JSON output or other formats, use the service directly
                     if files:
-                        response = await client.post(
+                        response = await _post_streaming(
+                            client,
                             f"{service_url}/general/v0/general",
                             files=files,
                             data=data
                         )
                     else:
-                        response = await client.post(
+                        response = await _post_streaming(
+                            client,
                             f"{service_url}/general/v0/general",
                             json=data
                         )
@@ -507,14 +547,14 @@ async def _convert_file(
                         service="libreoffice"
                     )
                 
-                await current_file.seek(0)  # Reset file pointer
-                file_content = await current_file.read()
+                upload_body = await _upload_body(current_file)
                 # Get MIME type for input file using standard library
                 mime_type = get_mime_type(input_format)
-                files = {"file": (current_file.filename, BytesIO(file_content), mime_type)}
+                files = {"file": (current_file.filename, upload_body, mime_type)}
                 data = {"convert-to": output_format}
 
-                response = await client.post(
+                response = await _post_streaming(
+                    client,
                     f"{service_url}/request",
                     files=files,
                     data=data
@@ -528,9 +568,8 @@ async def _convert_file(
                         service="pandoc"
                     )
                     
-                await current_file.seek(0)  # Reset file pointer
-                file_content = await current_file.read()
-                files = {"file": (current_file.filename, BytesIO(file_content), f"application/{input_format}")}
+                upload_body = await _upload_body(current_file)
+                files = {"file": (current_file.filename, upload_body, f"application/{input_format}")}
                 data = {"output_format": output_format}
 
                 # Map input format to pandoc format name and add as extra arg
@@ -577,7 +616,8 @@ async def _convert_file(
                     else:
                         data["extra_args"] = "--pdf-engine=pdflatex --standalone"
 
-                response = await client.post(
+                response = await _post_streaming(
+                    client,
                     f"{service_url}/pandoc",
                     files=files,
                     data=data
@@ -586,23 +626,24 @@ async def _convert_file(
             elif service_to_try == ConversionService.GOTENBERG:
                 # Gotenberg supports both files and URLs
                 if current_file:
-                    await current_file.seek(0)  # Reset file pointer
-                    file_content = await current_file.read()
+                    upload_body = await _upload_body(current_file)
                     # For HTML files, use the correct endpoint and filename
                     if input_format == 'html':
-                        files = {"index.html": ("index.html", BytesIO(file_content), f"application/{input_format}")}
+                        files = [("index.html", ("index.html", upload_body, f"application/{input_format}"))]
                         endpoint = "forms/chromium/convert/html"
                     elif input_format in ['docx', 'pptx', 'xlsx', 'xls', 'ppt', 'odt', 'ods', 'odp', 'pages', 'numbers']:
-                        files = {"files": (current_file.filename, BytesIO(file_content), f"application/{input_format}")}
+                        files = [("files", (current_file.filename, upload_body, f"application/{input_format}"))]
                         endpoint = "forms/libreoffice/convert"
                     else:
-                        files = {"files": (current_file.filename, BytesIO(file_content), f"application/{input_format}")}
+                        files = [("files", (current_file.filename, upload_body, f"application/{input_format}"))]
                         endpoint = "forms/chromium/convert/html"
                     data = {}
                 elif current_url:
                     # URL input for Gotenberg - prepare multipart form-data fields
                     # Use the `files` parameter so httpx builds multipart/form-data.
-                    files = {"url": (None, current_url)}
+                    # A list of (field, value) pairs is passed through to the
+                    # multipart encoder as-is, without dict normalization.
+                    files = [("url", (None, current_url))]
                     data = {}
                     endpoint = "forms/chromium/convert/url"
                 else:
@@ -613,25 +654,26 @@ async def _convert_file(
                     )
 
                 if extra_params:
-                    # Place extra params into the multipart payload as form fields
-                    for k, v in extra_params.items():
-                        files[k] = (None, str(v))
-
-                # Use the correct endpoint based on input type
-                if not current_file:
-                    # URL conversion always uses chromium
-                    endpoint = "forms/chromium/convert/url"
+                    # Place extra params into the multipart payload as form fields;
+                    # never let a user-supplied 'url' field shadow the real input URL
+                    files.extend(
+                        (k, (None, v if isinstance(v, str) else str(v)))
+                        for k, v in extra_params.items()
+                        if k != "url"
+                    )
 
                 # Send request with proper content type for URL inputs
                 if current_file:
-                    response = await client.post(
+                    response = await _post_streaming(
+                        client,
                         f"{service_url}/{endpoint}",
                         files=files,
                         data=data
                     )
                 else:
                     # For URL inputs, send as multipart/form-data using `files` form fields
-                    response = await client.post(
+                    response = await _post_streaming(
+                        client,
                         f"{service_url}/{endpoint}",
                         files=files
                     )
@@ -664,7 +706,7 @@ async def _convert_file(
                             }
                         )
                     except Exception as e:
-                        logger.error(f"URL to HTML conversion failed: {e}")
+                        logger.error("URL to HTML conversion failed: %s", e)
                         raise create_http_exception(
                             ErrorCode.URL_FETCH_FAILED,
                             details=f"Failed to fetch URL content: {str(e)}"
@@ -679,9 +721,11 @@ async def _convert_file(
                 await current_file.seek(0)  # Reset file pointer
                 file_content = await current_file.read()
                 
-                # Use the local conversion factory
-                factory = LocalConversionFactory()
-                content, media_type, output_filename = factory.convert(file_content, current_file.filename, input_format, output_format)
+                # Use the shared local conversion factory; parsing is synchronous,
+                # so run it off the event loop
+                content, media_type, output_filename = await asyncio.to_thread(
+                    convert_file_locally, file_content, current_file.filename, input_format, output_format
+                )
                 
                 # Return directly as StreamingResponse (skip the normal response handling)
                 return StreamingResponse(
@@ -733,8 +777,6 @@ async def _convert_file(
                             base_name = "url_content"
 
                     # Make request to pyconvert-service with retry logic
-                    from .http_client import get_http_client_factory, ServiceType
-                    
                     factory = get_http_client_factory()
                     response = await factory.post_with_retry(
                         ServiceType.PANDOC,  # Use PANDOC as the service type for pyconvert
@@ -744,7 +786,7 @@ async def _convert_file(
                     )
 
                     if response.status_code != 200:
-                        logger.error(f"Pyconvert WeasyPrint service returned {response.status_code}: {response.text}")
+                        logger.error("Pyconvert WeasyPrint service returned %s: %s", response.status_code, response.text)
                         raise create_http_exception(
                             ErrorCode.CONVERSION_FAILED,
                             details=f"WeasyPrint conversion failed: {response.text}",
@@ -765,14 +807,14 @@ async def _convert_file(
                     )
 
                 except httpx.RequestError as e:
-                    logger.error(f"Pyconvert service request failed: {e}")
+                    logger.error("Pyconvert service request failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.SERVICE_UNAVAILABLE,
                         details=f"WeasyPrint service unavailable: {str(e)}",
                         service="weasyprint"
                     )
                 except Exception as e:
-                    logger.error(f"WeasyPrint proxy failed: {e}")
+                    logger.error("WeasyPrint proxy failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.CONVERSION_FAILED,
                         details=f"HTML to PDF conversion failed: {str(e)}",
@@ -814,8 +856,6 @@ async def _convert_file(
                             data[key] = str(value)
 
                     # Make request to pyconvert-service with retry logic
-                    from .http_client import get_http_client_factory, ServiceType
-                    
                     factory = get_http_client_factory()
                     response = await factory.post_with_retry(
                         ServiceType.PANDOC,  # Use PANDOC as the service type for pyconvert
@@ -825,7 +865,7 @@ async def _convert_file(
                     )
 
                     if response.status_code != 200:
-                        logger.error(f"Pyconvert Mammoth service returned {response.status_code}: {response.text[:500]}")
+                        logger.error("Pyconvert Mammoth service returned %s: %s", response.status_code, response.text[:500])
                         raise create_http_exception(
                             ErrorCode.CONVERSION_FAILED,
                             details=f"Mammoth conversion failed: {response.text}",
@@ -847,14 +887,14 @@ async def _convert_file(
                     )
 
                 except httpx.RequestError as e:
-                    logger.error(f"Pyconvert service request failed: {e}")
+                    logger.error("Pyconvert service request failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.SERVICE_UNAVAILABLE,
                         details=f"Mammoth service unavailable: {str(e)}",
                         service="mammoth"
                     )
                 except Exception as e:
-                    logger.error(f"Mammoth proxy failed: {e}")
+                    logger.error("Mammoth proxy failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.CONVERSION_FAILED,
                         details=f"DOCX to HTML conversion failed: {str(e)}",
@@ -906,8 +946,6 @@ async def _convert_file(
                             data[key] = str(value)
 
                     # Make request to pyconvert-service with retry logic
-                    from .http_client import get_http_client_factory, ServiceType
-                    
                     factory = get_http_client_factory()
                     response = await factory.post_with_retry(
                         ServiceType.PANDOC,  # Use PANDOC as the service type for pyconvert
@@ -917,7 +955,7 @@ async def _convert_file(
                     )
 
                     if response.status_code != 200:
-                        logger.error(f"Pyconvert html4docx service returned {response.status_code}: {response.text[:500]}")
+                        logger.error("Pyconvert html4docx service returned %s: %s", response.status_code, response.text[:500])
                         raise create_http_exception(
                             ErrorCode.CONVERSION_FAILED,
                             details=f"html4docx conversion failed: {response.text}",
@@ -938,14 +976,14 @@ async def _convert_file(
                     )
 
                 except httpx.RequestError as e:
-                    logger.error(f"Pyconvert service request failed: {e}")
+                    logger.error("Pyconvert service request failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.SERVICE_UNAVAILABLE,
                         details=f"html4docx service unavailable: {str(e)}",
                         service="html4docx"
                     )
                 except Exception as e:
-                    logger.error(f"html4docx proxy failed: {e}")
+                    logger.error("html4docx proxy failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.CONVERSION_FAILED,
                         details=f"HTML to DOCX conversion failed: {str(e)}",
@@ -997,8 +1035,6 @@ async def _convert_file(
                             data[key] = str(value)
 
                     # Make request to pyconvert-service with retry logic
-                    from .http_client import get_http_client_factory, ServiceType
-                    
                     factory = get_http_client_factory()
                     response = await factory.post_with_retry(
                         ServiceType.PANDOC,  # Use PANDOC as the service type for pyconvert
@@ -1008,7 +1044,7 @@ async def _convert_file(
                     )
 
                     if response.status_code != 200:
-                        logger.error(f"Pyconvert BeautifulSoup service returned {response.status_code}: {response.text}")
+                        logger.error("Pyconvert BeautifulSoup service returned %s: %s", response.status_code, response.text)
                         raise create_http_exception(
                             ErrorCode.CONVERSION_FAILED,
                             details=f"BeautifulSoup conversion failed: {response.text}",
@@ -1029,14 +1065,14 @@ async def _convert_file(
                     )
 
                 except httpx.RequestError as e:
-                    logger.error(f"Pyconvert service request failed: {e}")
+                    logger.error("Pyconvert service request failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.SERVICE_UNAVAILABLE,
                         details=f"BeautifulSoup service unavailable: {str(e)}",
                         service="beautifulsoup"
                     )
                 except Exception as e:
-                    logger.error(f"BeautifulSoup proxy failed: {e}")
+                    logger.error("BeautifulSoup proxy failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.CONVERSION_FAILED,
                         details=f"HTML cleaning failed: {str(e)}",
@@ -1081,8 +1117,6 @@ async def _convert_file(
                             data[key] = str(value)
 
                     # Make request to pyconvert-service with retry logic
-                    from .http_client import get_http_client_factory, ServiceType
-                    
                     factory = get_http_client_factory()
                     response = await factory.post_with_retry(
                         ServiceType.PANDOC,  # Use PANDOC as the service type for pyconvert
@@ -1092,7 +1126,7 @@ async def _convert_file(
                     )
 
                     if response.status_code != 200:
-                        logger.error(f"Pyconvert PyMuPDF service returned {response.status_code}: {response.text[:500]}")
+                        logger.error("Pyconvert PyMuPDF service returned %s: %s", response.status_code, response.text[:500])
                         raise create_http_exception(
                             ErrorCode.CONVERSION_FAILED,
                             details=f"PyMuPDF conversion failed: {response.text}",
@@ -1120,14 +1154,14 @@ async def _convert_file(
                     )
 
                 except httpx.RequestError as e:
-                    logger.error(f"Pyconvert service request failed: {e}")
+                    logger.error("Pyconvert service request failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.SERVICE_UNAVAILABLE,
                         details=f"PyMuPDF service unavailable: {str(e)}",
                         service="pymupdf"
                     )
                 except Exception as e:
-                    logger.error(f"PyMuPDF proxy failed: {e}")
+                    logger.error("PyMuPDF proxy failed: %s", e)
                     raise create_http_exception(
                         ErrorCode.CONVERSION_FAILED,
                         details=f"PDF to {output_format.upper()} conversion failed: {str(e)}",
@@ -1141,9 +1175,10 @@ async def _convert_file(
                     service=str(service_to_try)
                 )
             
-            # Check response
+            # Check response (the body is streamed, so read it before using response.text)
             if response.status_code != 200:
-                logger.error(f"Service {service_to_try} returned {response.status_code}: {response.text}")
+                await response.aread()
+                logger.error("Service %s returned %s: %s", service_to_try, response.status_code, response.text)
                 raise create_http_exception(
                     ErrorCode.SERVICE_ERROR,
                     details=f"Conversion failed: {response.text}",
@@ -1151,8 +1186,9 @@ async def _convert_file(
                     status_code=response.status_code
                 )
 
-            # Determine content type based on output format
-            content_type = get_mime_type(output_format)
+            # Determine content type based on output format (static table first,
+            # full detector only for formats outside the table)
+            content_type = FORMAT_MIME_TYPES.get(output_format) or get_mime_type(output_format)
 
             # Generate output filename
             if current_file:
@@ -1168,24 +1204,27 @@ async def _convert_file(
             
             output_filename = f"{base_name}.{output_format}"
 
+            # Pipe the upstream body straight through; the background task closes
+            # the upstream stream even if the client disconnects mid-transfer
             return StreamingResponse(
-                BytesIO(response.content),
+                response.aiter_bytes(),
                 media_type=content_type,
                 headers={
                     "Content-Disposition": f"attachment; filename={output_filename}",
                     "X-Conversion-Service": service_to_try.value
-                }
+                },
+                background=BackgroundTask(response.aclose)
             )
 
         except httpx.RequestError as e:
-            logger.error(f"Request error for {service_to_try}: {e}")
+            logger.error("Request error for %s: %s", service_to_try, e)
             # Don't clean up resources here - keep them for other services to try
             # if url_input:
             #     await url_input.cleanup()
             last_error = HTTPException(status_code=503, detail=f"Service {service_to_try} unavailable")
             continue  # Try next service
         except Exception as e:
-            logger.error(f"Conversion error with {service_to_try}: {e}")
+            logger.error("Conversion error with %s: %s", service_to_try, e)
             import traceback
             # Don't clean up resources here - keep them for other services to try
             # if url_input:
@@ -1193,8 +1232,11 @@ async def _convert_file(
             last_error = HTTPException(status_code=500, detail=f"Conversion failed: {str(e)}")
             continue  # Try next service
         finally:
-            # Only clean up on successful conversion - resources will be cleaned up by the response handler
-            pass
+            # The upstream request has been fully sent by now. A per-service
+            # wrapper from url_input is ours to close; the caller's upload is
+            # not. Other resources are cleaned up by the response handler.
+            if upload_body is not None and url_input and hasattr(current_file, "close"):
+                await current_file.close()
     
     # If we get here without success, all services failed
     if last_error:
@@ -1209,6 +1251,164 @@ async def _convert_file(
         raise HTTPException(status_code=500, detail="All conversion services failed")
 
 
+async def _read_response_body(response: Any) -> bytes:
+    """Drain a conversion response into memory and run its background cleanup."""
+    try:
+        if hasattr(response, "body_iterator"):
+            body = bytearray()
+            async for chunk in response.body_iterator:
+                body += chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+            return bytes(body)
+        return bytes(response.body)
+    finally:
+        if response.background is not None:
+            await response.background()
+
+
+async def convert_batch(
+    request: Request,
+    files: List[UploadFile],
+    input_format: str,
+    output_format: str,
+    extra_params: Optional[dict] = None
+) -> List[Dict[str, Any]]:
+    """
+    Convert several uploaded files concurrently.
+
+    Each file goes through the regular single-file pipeline (``_convert_file``),
+    sharing the app's service clients. At most ``CONVERT_CONCURRENCY`` batch
+    files are converted at once across all requests, so large batches do not
+    flood the backend services.
+
+    Args:
+        request: FastAPI request object
+        files: Uploaded files, all in ``input_format``
+        input_format: Input file format
+        output_format: Desired output format
+        extra_params: Additional parameters applied to every file
+
+    Returns:
+        One result per input file, in input order. Successful entries contain
+        ``filename``, ``output_filename`` and ``content``; failed entries contain
+        ``filename`` and ``error``. Once the converted output exceeds
+        ``BATCH_MAX_BYTES``, the remaining files fail instead of being kept.
+
+    Raises:
+        HTTPException: If the batch has more than ``BATCH_MAX_FILES`` files
+    """
+    if len(files) > BATCH_MAX_FILES:
+        raise create_http_exception(
+            ErrorCode.PARAMETER_OUT_OF_RANGE,
+            details=f"A batch may contain at most {BATCH_MAX_FILES} files, got {len(files)}"
+        )
+
+    params = extra_params if extra_params is not None else {}
+    budget_error = f"Batch output exceeds {BATCH_MAX_BYTES} bytes"
+    output_bytes = 0
+
+    async def convert_one(upload: UploadFile) -> Dict[str, Any]:
+        nonlocal output_bytes
+        async with _conversion_semaphore:
+            if output_bytes > BATCH_MAX_BYTES:
+                raise create_http_exception(ErrorCode.FILE_TOO_LARGE, details=budget_error)
+            response = await _convert_file(
+                request,
+                file=upload,
+                input_format=input_format,
+                output_format=output_format,
+                extra_params=dict(params)
+            )
+            content = await _read_response_body(response)
+            output_bytes += len(content)
+            if output_bytes > BATCH_MAX_BYTES:
+                # Drop this output too, so memory stays near the budget
+                raise create_http_exception(ErrorCode.FILE_TOO_LARGE, details=budget_error)
+
+        disposition = response.headers.get("content-disposition", "")
+        _, _, output_filename = disposition.partition("filename=")
+        return {
+            "filename": upload.filename,
+            "output_filename": output_filename.strip('"') or f"converted.{output_format}",
+            "content": content
+        }
+
+    results = await asyncio.gather(*(convert_one(f) for f in files), return_exceptions=True)
+
+    batch = []
+    for upload, result in zip(files, results):
+        if isinstance(result, BaseException):
+            logger.warning("Batch conversion failed for %s: %s", upload.filename, result)
+            detail = getattr(result, "detail", result)
+            # Keep structured HTTPException details as-is so the manifest stays valid JSON
+            batch.append({
+                "filename": upload.filename,
+                "error": detail if isinstance(detail, (dict, list)) else str(detail)
+            })
+        else:
+            batch.append(result)
+    return batch
+
+
+def build_batch_archive(results: List[Dict[str, Any]]) -> BytesIO:
+    """
+    Package batch conversion results as a zip archive with a manifest (blocking).
+
+    Compression is CPU-bound, so async callers should run this in a worker
+    thread rather than on the event loop.
+
+    Args:
+        results: Entries as returned by ``convert_batch``
+
+    Returns:
+        Archive positioned at the start, containing each converted file plus
+        ``manifest.json`` describing every result
+    """
+    archive = BytesIO()
+    manifest = []
+    used_names = set()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        for index, result in enumerate(results):
+            entry = {"filename": result["filename"]}
+            if "error" in result:
+                entry["error"] = result["error"]
+            else:
+                name = result["output_filename"]
+                if name in used_names:
+                    name = f"{index}_{name}"
+                used_names.add(name)
+                zf.writestr(name, result["content"])
+                entry["output_filename"] = name
+            manifest.append(entry)
+        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+    archive.seek(0)
+    return archive
+
+
+def _coerce_form_value(value: str) -> Any:
+    """
+    Convert a form field string to bool, int or float where possible.
+
+    Args:
+        value: Raw form field value
+
+    Returns:
+        The coerced value, or the original string if it is not a boolean or number
+    """
+    lowered = value.lower()
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    # Leave 'nan'/'inf' style strings alone - they are almost never meant as numbers
+    return number if math.isfinite(number) else value
+
+
 async def extract_request_params(request: Request) -> Dict[str, Any]:
     """
     Extract all form parameters from a multipart/form-data request.
@@ -1231,19 +1431,8 @@ async def extract_request_params(request: Request) -> Dict[str, Any]:
         # Extract all form fields except 'file' and 'url' which are handled separately
         for field_name, field_value in form_data.items():
             if field_name not in ['file', 'url'] and field_value is not None:
-                # Convert field value to appropriate type
-                if isinstance(field_value, str):
-                    # Try to convert to appropriate type
-                    if field_value.lower() in ('true', 'false'):
-                        params[field_name] = field_value.lower() == 'true'
-                    elif field_value.isdigit():
-                        params[field_name] = int(field_value)
-                    elif field_value.replace('.', '').isdigit():
-                        params[field_name] = float(field_value)
-                    else:
-                        params[field_name] = field_value
-                else:
-                    params[field_name] = field_value
+                # Convert string field values to appropriate types
+                params[field_name] = _coerce_form_value(field_value) if isinstance(field_value, str) else field_value
                     
     except Exception as e:
         logger.warning(f"Failed to extract form parameters: {e}")
@@ -1269,10 +1458,14 @@ def fix_table_text_as_html(json_data: list) -> list:
     for item in json_data:
         if item.get('type') == 'Table':
             text = item.get('text', '').strip()
-            text_as_html = item.get('metadata', {}).get('text_as_html', '').strip()
+            text_as_html = item.get('metadata', {}).get('text_as_html', '')
             
-            # Skip if text_as_html already looks complete or text is empty
-            if not text or (text_as_html and '<td>' in text_as_html and '</td>' in text_as_html and text_as_html.count('<td>') > text_as_html.count('<td></td>')):
+            # Skip if text is empty or text_as_html already looks complete
+            # (has at least one non-empty cell; a non-zero count implies '<td>' is present)
+            if not text:
+                continue
+            open_cells = text_as_html.count('<td>')
+            if open_cells and open_cells > text_as_html.count('<td></td>') and '</td>' in text_as_html:
                 continue
                 
             # Try to reconstruct HTML table from text
@@ -1286,10 +1479,14 @@ def fix_table_text_as_html(json_data: list) -> list:
     return json_data
 
 
+@lru_cache(maxsize=1024)
 def _reconstruct_table_html(text: str) -> str:
     """
     Reconstruct HTML table markup from plain text table content.
     
+    Results are memoized because unstructured-io often repeats the same
+    boilerplate tables (headers, footers) across pages.
+    
     Handles various table formats:
     - Tab-separated values
     - Space-separated with consistent column structure
@@ -1385,17 +1582,11 @@ def _reconstruct_table_html(text: str) -> str:
     
     # Generate HTML if we have table data
     if table_data and len(table_data) > 1:  # Need at least header + 1 data row
-        html_parts = ['<table><tbody>']
-        
-        for row in table_data:
-            html_parts.append('<tr>')
-            for cell in row:
-                # Escape HTML entities
-                cell = cell.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                html_parts.append(f'<td>{cell}</td>')
-            html_parts.append('</tr>')
-        
-        html_parts.append('</tbody></table>')
-        return ''.join(html_parts)
+        # One string per row; cells are HTML-escaped as they are emitted
+        rows = ''.join(
+            '<tr>' + ''.join(f'<td>{_html_escape(cell, quote=False)}</td>' for cell in row) + '</tr>'
+            for row in table_data
+        )
+        return f'<table><tbody>{rows}</tbody></table>'
     
     return ""
@@ -5,11 +5,20 @@ This module contains utility functions for looking up conversion methods,
 supported formats, and service configurations.
 """
 
+from collections import defaultdict
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 import socket
 from ..config import CONVERSION_MATRIX, SERVICE_URL_CONFIGS, ConversionService
 
 
+# Format aliases to handle common variations
+FORMAT_ALIASES = {
+    "tex": "latex",  # tex and latex are the same format
+    "latex": "latex"
+}
+
+
 def get_service_urls() -> Dict[str, str]:
     """
     Get service URLs with fallback mechanism for Docker vs local development.
@@ -53,10 +62,14 @@ def get_dynamic_service_urls():
 DYNAMIC_SERVICE_URLS = get_dynamic_service_urls()
 
 
+@lru_cache(maxsize=512)
 def get_conversion_methods(input_format: str, output_format: str) -> List[Tuple[ConversionService, str]]:
     """
     Get available conversion methods for a given input/output format pair.
 
+    Results are cached; CONVERSION_MATRIX is static at runtime and the returned
+    list is the matrix entry itself, so callers must treat it as read-only.
+
     Args:
         input_format: Input file format (e.g., 'docx', 'pdf')
         output_format: Output file format (e.g., 'pdf', 'json')
@@ -64,20 +77,15 @@ def get_conversion_methods(input_format: str, output_format: str) -> List[Tuple[
     Returns:
         List of tuples containing (service, description)
     """
-    # Format aliases to handle common variations
-    format_aliases = {
-        "tex": "latex",  # tex and latex are the same format
-        "latex": "latex"
-    }
-    
     # Normalize input and output formats using aliases
-    normalized_input = format_aliases.get(input_format.lower(), input_format.lower())
+    normalized_input = FORMAT_ALIASES.get(input_format.lower(), input_format.lower())
     normalized_output = output_format.lower()
     
     key = (normalized_input, normalized_output)
     return CONVERSION_MATRIX.get(key, [])
 
 
+@lru_cache(maxsize=512)
 def get_primary_conversion(input_format: str, output_format: str) -> Optional[Tuple[ConversionService, str]]:
     """
     Get the primary (highest quality) conversion method for a format pair.
@@ -134,18 +142,18 @@ def get_all_conversions(input_format: str, output_format: str) -> List[Tuple[Con
     return result
 
 
+@lru_cache(maxsize=1)
 def get_supported_conversions() -> Dict[str, List[str]]:
     """
     Get all supported input formats and their possible output formats.
 
+    The result is computed once and cached, so callers must not mutate it.
+
     Returns:
-        Dictionary mapping input formats to lists of output formats
+        Dictionary mapping input formats to sorted lists of output formats
     """
-    supported = {}
-    for (input_fmt, output_fmt), _ in CONVERSION_MATRIX.items():
-        if input_fmt not in supported:
-            supported[input_fmt] = []
-        if output_fmt not in supported[input_fmt]:
-            supported[input_fmt].append(output_fmt)
-
-    return supported
+    supported = defaultdict(set)
+    for input_fmt, output_fmt in CONVERSION_MATRIX:
+        supported[input_fmt].add(output_fmt)
+
+    return {input_fmt: sorted(output_fmts) for input_fmt, output_fmts in supported.items()}
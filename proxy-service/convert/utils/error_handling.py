@@ -6,11 +6,21 @@ utilities across all services and endpoints.
 """
 
 import logging
-from datetime import datetime
+import re
+import time
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Dict, Any, Optional, Union
+from functools import lru_cache, singledispatch
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, Union
 from fastapi import HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+
+if TYPE_CHECKING:
+    # Only needed for annotations of the exception handlers
+    from fastapi import Request
+    from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from .orjson_response import ORJSONResponse, dumps_json
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +115,108 @@ ERROR_SEVERITY_MAP: Dict[ErrorCode, ErrorSeverity] = {
     ErrorCode.NOT_FOUND: ErrorSeverity.LOW,
 }
 
+# Error severity to logging level mapping
+_SEVERITY_LOG_LEVEL: Dict[ErrorSeverity, int] = {
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+    ErrorSeverity.HIGH: logging.ERROR,
+    ErrorSeverity.MEDIUM: logging.WARNING,
+    ErrorSeverity.LOW: logging.INFO,
+}
+
+# Patterns used to classify service failures from their exception message
+_TIMEOUT_ERROR_RE = re.compile(r"timeout|timed out", re.IGNORECASE)
+_UNAVAILABLE_ERROR_RE = re.compile(r"connection|unreachable", re.IGNORECASE)
+
+# Error code -> (error type, HTTP status code, severity), resolved once at import
+_ERROR_TABLE: Dict[ErrorCode, Tuple[str, int, ErrorSeverity]] = {
+    code: (
+        code.value,
+        ERROR_STATUS_MAP.get(code, 500),
+        ERROR_SEVERITY_MAP.get(code, ErrorSeverity.MEDIUM),
+    )
+    for code in ErrorCode
+}
+
+@singledispatch
+def _lookup_error(error_code: Any) -> Optional[Tuple[str, int, ErrorSeverity]]:
+    """Return the (error type, status code, severity) entry for an ErrorCode; None for custom codes."""
+    return None
+
+
+@_lookup_error.register
+def _(error_code: ErrorCode) -> Optional[Tuple[str, int, ErrorSeverity]]:
+    return _ERROR_TABLE.get(error_code)
+
+
+# Pre-rendered JSON bodies (without the closing brace and timestamp) for errors
+# that carry no service, details or extra fields
+_STATIC_ERROR_BODY_PREFIX: Dict[ErrorCode, bytes] = {
+    code: dumps_json({
+        "error": error_type,
+        "status_code": status_code,
+        "severity": severity.value
+    })[:-1]
+    for code, (error_type, status_code, severity) in _ERROR_TABLE.items()
+}
+
+
+# Maximum length of the "details" field. This keeps error payloads small enough
+# to render in one orjson call, even when a service dumps large stderr output.
+MAX_ERROR_DETAILS_LENGTH = 1000
+MAX_HTTP_EXCEPTION_DETAILS_LENGTH = 500
+
+# (epoch milliseconds, formatted timestamp) of the last error timestamp built
+_timestamp_cache = (0, "")
+
+
+def _utcnow_iso() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with millisecond precision.
+
+    The formatted string is reused for every call within the same millisecond.
+    """
+    global _timestamp_cache
+    now = time.time()
+    millis = int(now * 1000)
+    cached_millis, cached = _timestamp_cache
+    if millis == cached_millis:
+        return cached
+    stamp = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z"
+    _timestamp_cache = (millis, stamp)
+    return stamp
+
+
+class AppXtracError(Exception):
+    """
+    Exception carrying a standardized error, rendered by app_error_handler.
+
+    Raise it from endpoints instead of building error responses by hand; the
+    registered handler turns it into the same payload as create_error_response.
+    """
+
+    __slots__ = ("code", "service", "details", "status_code", "extra")
+
+    def __init__(
+        self,
+        code: Union[ErrorCode, str],
+        service: Optional[str] = None,
+        details: Optional[str] = None,
+        status_code: Optional[int] = None,
+        **extra
+    ):
+        super().__init__(details or str(code))
+        self.code = code
+        self.service = service
+        self.details = details
+        self.status_code = status_code
+        self.extra = extra
+
+
+def _truncate(value: Any, limit: int) -> str:
+    """Return value as a string of at most limit characters, slicing only when needed."""
+    text = value if type(value) is str else str(value)
+    return text if len(text) <= limit else text[:limit]
+
 
 def create_error_response(
     error_code: Union[ErrorCode, str],
@@ -112,60 +224,59 @@ def create_error_response(
     details: Optional[str] = None,
     status_code: Optional[int] = None,
     **kwargs
-) -> JSONResponse:
+) -> Response:
     """
     Create a consistent JSON error response across all endpoints.
 
     Args:
         error_code: Error code from ErrorCode enum or custom string
         service: Service name that generated the error
-        details: Additional error details (will be truncated to 1000 chars)
+        details: Additional error details (truncated to MAX_ERROR_DETAILS_LENGTH chars)
         status_code: Override the default HTTP status code
         **kwargs: Additional fields to include in the error response
 
     Returns:
-        JSONResponse with standardized error format
+        JSON response with standardized error format
     """
     # Handle both ErrorCode enum and string error codes
-    if isinstance(error_code, ErrorCode):
-        error_type = error_code.value
-        if status_code is None:
-            status_code = ERROR_STATUS_MAP.get(error_code, 500)
-        severity = ERROR_SEVERITY_MAP.get(error_code, ErrorSeverity.MEDIUM)
+    entry = _lookup_error(error_code)
+    if entry:
+        error_type, default_status, severity = entry
     else:
-        error_type = str(error_code)
-        if status_code is None:
-            status_code = 500
-        severity = ErrorSeverity.MEDIUM
+        error_type, default_status, severity = str(error_code), 500, ErrorSeverity.MEDIUM
+    if status_code is None:
+        status_code = default_status
+
+    # Fast path: a bare error code only needs the timestamp spliced into its pre-rendered body
+    if entry and status_code == default_status and not service and not details and not kwargs:
+        timestamp = _utcnow_iso()
+        log_level = _SEVERITY_LOG_LEVEL[severity]
+        if logger.isEnabledFor(log_level):
+            logger.log(log_level, "Error response: %s %s", error_type, status_code)
+        body = _STATIC_ERROR_BODY_PREFIX[error_code] + b',"timestamp":"' + timestamp.encode("ascii") + b'"}'
+        return Response(content=body, status_code=status_code, media_type="application/json")
 
     error_data = {
         "error": error_type,
-        "timestamp": datetime.now().isoformat() + "Z",
+        "timestamp": _utcnow_iso(),
         "status_code": status_code,
         "severity": severity.value
     }
 
     if service:
         error_data["service"] = service
-
     if details:
-        error_data["details"] = str(details)[:1000]  # Limit details length
-
-    # Add any additional fields
-    error_data.update(kwargs)
-
-    # Log the error with appropriate level
-    log_message = f"Error response: {error_data}"
-    if severity == ErrorSeverity.CRITICAL:
-        logger.critical(log_message)
-    elif severity == ErrorSeverity.HIGH:
-        logger.error(log_message)
-    elif severity == ErrorSeverity.MEDIUM:
-        logger.warning(log_message)
-    else:
-        logger.info(log_message)
+        error_data["details"] = _truncate(details, MAX_ERROR_DETAILS_LENGTH)
+    if kwargs:
+        # Add any additional fields
+        error_data.update(kwargs)
 
-    return JSONResponse(status_code=status_code, content=error_data)
+    # Log the error with appropriate level; formatting is skipped when filtered out
+    log_level = _SEVERITY_LOG_LEVEL[severity]
+    if logger.isEnabledFor(log_level):
+        logger.log(log_level, "Error response: %r", error_data)
+
+    return ORJSONResponse(status_code=status_code, content=error_data)
 
 
 def create_http_exception(
@@ -184,21 +295,21 @@ def create_http_exception(
     Returns:
         HTTPException with standardized error format
     """
-    if isinstance(error_code, ErrorCode):
-        status_code = ERROR_STATUS_MAP.get(error_code, 500)
+    entry = _lookup_error(error_code)
+    if entry:
+        error_type, status_code, _ = entry
     else:
-        status_code = 500
+        error_type, status_code = str(error_code), 500
 
     # Create error details in a consistent format
     error_details = {
-        "error": error_code.value if isinstance(error_code, ErrorCode) else str(error_code),
-        "timestamp": datetime.now().isoformat() + "Z"
+        "error": error_type,
+        "timestamp": _utcnow_iso()
     }
-
     if details:
-        error_details["details"] = str(details)[:500]  # Shorter limit for HTTP exceptions
-
-    error_details.update(kwargs)
+        error_details["details"] = _truncate(details, MAX_HTTP_EXCEPTION_DETAILS_LENGTH)
+    if kwargs:
+        error_details.update(kwargs)
 
     return HTTPException(
         status_code=status_code,
@@ -212,7 +323,7 @@ def handle_conversion_error(
     output_format: str,
     service: Optional[str] = None,
     details: Optional[str] = None
-) -> Union[HTTPException, JSONResponse]:
+) -> Union[HTTPException, Response]:
     """
     Handle conversion-specific errors with consistent formatting.
 
@@ -224,14 +335,15 @@ def handle_conversion_error(
         details: Additional error details
 
     Returns:
-        HTTPException for client errors, JSONResponse for server errors
+        HTTPException for client errors, ORJSONResponse for server errors
     """
     error_details = f"Conversion from {input_format} to {output_format} failed"
     if details:
         error_details += f": {details}"
 
-    # Use HTTPException for client errors (4xx), JSONResponse for server errors (5xx)
-    status_code = ERROR_STATUS_MAP.get(error_code, 500)
+    # Use HTTPException for client errors (4xx), ORJSONResponse for server errors (5xx)
+    entry = _lookup_error(error_code)
+    status_code = entry[1] if entry else 500
 
     if 400 <= status_code < 500:
         return create_http_exception(error_code, details=error_details, service=service)
@@ -249,7 +361,7 @@ def handle_service_error(
     service: str,
     error: Exception,
     operation: str = "operation"
-) -> JSONResponse:
+) -> Response:
     """
     Handle service-specific errors with appropriate error codes.
 
@@ -259,14 +371,15 @@ def handle_service_error(
         operation: Description of the operation that failed
 
     Returns:
-        JSONResponse with service error details
+        JSON response with service error details
     """
-    error_message = f"{operation} failed for service '{service}': {str(error)}"
+    error_text = str(error)
+    error_message = f"{operation} failed for service '{service}': {error_text}"
 
-    # Determine error code based on exception type
-    if "timeout" in str(error).lower() or "timed out" in str(error).lower():
+    # Determine error code based on the exception message
+    if _TIMEOUT_ERROR_RE.search(error_text):
         error_code = ErrorCode.SERVICE_TIMEOUT
-    elif "connection" in str(error).lower() or "unreachable" in str(error).lower():
+    elif _UNAVAILABLE_ERROR_RE.search(error_text):
         error_code = ErrorCode.SERVICE_UNAVAILABLE
     else:
         error_code = ErrorCode.SERVICE_ERROR
@@ -279,6 +392,12 @@ def handle_service_error(
     )
 
 
+@lru_cache(maxsize=None)
+def _format_pattern(min_length: int, max_length: int) -> "re.Pattern[str]":
+    """Return the compiled pattern for ASCII alphanumeric formats of the given length range."""
+    return re.compile(rf"[A-Za-z0-9]{{{min_length},{max_length}}}")
+
+
 def validate_format_parameter(
     format_value: str,
     param_name: str,
@@ -297,6 +416,10 @@ def validate_format_parameter(
     Raises:
         HTTPException: If validation fails
     """
+    # Fast path: the common case is a short ASCII format like 'docx'
+    if isinstance(format_value, str) and _format_pattern(min_length, max_length).fullmatch(format_value):
+        return
+
     if not isinstance(format_value, str):
         raise create_http_exception(
             ErrorCode.INVALID_PARAMETER,
@@ -314,3 +437,31 @@ def validate_format_parameter(
             ErrorCode.INVALID_FORMAT,
             details=f"{param_name} must contain only alphanumeric characters"
         )
+
+
+async def http_exception_handler(request: "Request", exc: "StarletteHTTPException") -> Response:
+    """
+    Render HTTPExceptions (including those from create_http_exception) with orjson.
+
+    Produces the same ``{"detail": ...}`` body as FastAPI's default handler.
+    Register it with ``app.add_exception_handler(StarletteHTTPException, http_exception_handler)``.
+    """
+    headers = getattr(exc, "headers", None)
+    if exc.status_code in (204, 304):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
+async def app_error_handler(request: "Request", exc: AppXtracError) -> Response:
+    """
+    Render an AppXtracError as a standardized JSON error response.
+
+    Register it with ``app.add_exception_handler(AppXtracError, app_error_handler)``.
+    """
+    return create_error_response(
+        exc.code,
+        service=exc.service,
+        details=exc.details,
+        status_code=exc.status_code,
+        **exc.extra
+    )
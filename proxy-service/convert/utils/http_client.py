@@ -9,19 +9,65 @@ import os
 import logging
 import asyncio
 import random
+import time
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any, Callable, TypeVar, Awaitable
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Callable, TypeVar, Awaitable, Union
 from enum import Enum
 
 import httpx
 
+# HTTP/2 support requires the optional 'h2' package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
+def _read_http_timeout() -> Optional[float]:
+    """Read the upstream read timeout from the environment (empty = no timeout)."""
+    http_timeout_str = os.getenv('APPLITEXTRAC_HTTP_TIMEOUT', '')
+    if not http_timeout_str.strip():
+        os.environ['APPLITEXTRAC_HTTP_TIMEOUT'] = ''
+        return None
+    return float(http_timeout_str)
+
+
+# Read timeout for upstream services, resolved once at import
+HTTP_READ_TIMEOUT = _read_http_timeout()
+
+# Default connection pool sizing. A larger pool avoids PoolTimeout under
+# concurrent fan-out. Backends that degrade under contention may do better
+# with far fewer connections (5-10), so these can be tuned per deployment.
+HTTP_MAX_CONNECTIONS = int(os.getenv('APPLITEXTRAC_HTTP_MAX_CONNECTIONS', '256'))
+HTTP_MAX_KEEPALIVE = int(os.getenv('APPLITEXTRAC_HTTP_MAX_KEEPALIVE', '40'))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv('APPLITEXTRAC_HTTP_KEEPALIVE_EXPIRY', '30.0'))
+
+
 class RetryConfig:
-    """Configuration for HTTP request retry behavior."""
+    """
+    Configuration for HTTP request retry behavior.
+
+    Instances are immutable once created; build a new one to change settings.
+    """
+
+    __slots__ = (
+        'max_attempts',
+        'base_delay',
+        'max_delay',
+        'backoff_factor',
+        'jitter',
+        'retry_on_status_codes',
+        'retry_on_exceptions',
+        'retry_exceptions',
+        'retry_status_codes',
+        '_delay_schedule',
+    )
     
     def __init__(
         self,
@@ -45,21 +91,37 @@ class RetryConfig:
             retry_on_status_codes: HTTP status codes to retry on (default: 5xx errors)
             retry_on_exceptions: Exception types to retry on (default: network errors)
         """
-        self.max_attempts = max_attempts
-        self.base_delay = base_delay
-        self.max_delay = max_delay
-        self.backoff_factor = backoff_factor
-        self.jitter = jitter
+        # __setattr__ is blocked, so assign through object directly
+        _set = object.__setattr__
+        _set(self, 'max_attempts', max_attempts)
+        _set(self, 'base_delay', base_delay)
+        _set(self, 'max_delay', max_delay)
+        _set(self, 'backoff_factor', backoff_factor)
+        _set(self, 'jitter', jitter)
         
         # Default retry conditions
-        self.retry_on_status_codes = retry_on_status_codes or [500, 502, 503, 504, 408, 429]
-        self.retry_on_exceptions = retry_on_exceptions or [
+        retry_on_status_codes = retry_on_status_codes or [500, 502, 503, 504, 408, 429]
+        retry_on_exceptions = retry_on_exceptions or [
             httpx.ConnectError,
             httpx.ConnectTimeout,
             httpx.ReadTimeout,
             httpx.PoolTimeout,
             httpx.NetworkError
         ]
+        _set(self, 'retry_on_status_codes', retry_on_status_codes)
+        _set(self, 'retry_on_exceptions', retry_on_exceptions)
+
+        # Lookup-friendly forms used by retry_request on every attempt
+        _set(self, 'retry_exceptions', tuple(retry_on_exceptions))
+        _set(self, 'retry_status_codes', frozenset(retry_on_status_codes))
+        # Backoff ceiling per attempt: base_delay * backoff_factor ** attempt, capped at max_delay
+        _set(self, '_delay_schedule', tuple(
+            min(max_delay, base_delay * (backoff_factor ** attempt))
+            for attempt in range(max(max_attempts, 1))
+        ))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"RetryConfig is immutable; cannot set {name!r}")
     
     @classmethod
     def from_env(cls) -> 'RetryConfig':
@@ -73,6 +135,10 @@ class RetryConfig:
         )
 
 
+# Retry settings from the environment, resolved once at import
+_DEFAULT_RETRY = RetryConfig.from_env()
+
+
 async def retry_request(
     func: Callable[[], Awaitable[T]],
     config: RetryConfig,
@@ -92,10 +158,15 @@ async def retry_request(
     Raises:
         The last exception if all retries are exhausted
     """
+    # Retries disabled: a single direct call
+    if config.max_attempts <= 1:
+        return await func()
+    
     if logger is None:
         logger = logging.getLogger(__name__)
     
     last_exception = None
+    prev_delay = config.base_delay
     
     for attempt in range(config.max_attempts):
         try:
@@ -103,13 +174,19 @@ async def retry_request(
             result = await func()
             
             # Check if we should retry based on response status
-            if hasattr(result, 'status_code') and result.status_code in config.retry_on_status_codes:
+            if hasattr(result, 'status_code') and result.status_code in config.retry_status_codes:
                 if attempt < config.max_attempts - 1:  # Don't log on last attempt
                     logger.warning(
                         f"Request failed with status {result.status_code}, "
                         f"retrying ({attempt + 1}/{config.max_attempts})"
                     )
-                    await _delay_before_retry(attempt, config)
+                    # Prefer the server's own scheduling hint when it is reasonable
+                    retry_after = _parse_retry_after(getattr(result, 'headers', {}).get('Retry-After'))
+                    if retry_after is not None and retry_after <= config.max_delay:
+                        logger.debug("Honoring Retry-After: waiting %.2fs before retry", retry_after)
+                        await asyncio.sleep(retry_after)
+                    else:
+                        prev_delay = await _delay_before_retry(attempt, config, prev_delay)
                     continue
             
             # Success - return the result
@@ -117,14 +194,14 @@ async def retry_request(
                 logger.info(f"Request succeeded on attempt {attempt + 1}")
             return result
             
-        except tuple(config.retry_on_exceptions) as e:
+        except config.retry_exceptions as e:
             last_exception = e
             if attempt < config.max_attempts - 1:  # Don't log on last attempt
                 logger.warning(
                     f"Request failed with {type(e).__name__}: {e}, "
                     f"retrying ({attempt + 1}/{config.max_attempts})"
                 )
-                await _delay_before_retry(attempt, config)
+                prev_delay = await _delay_before_retry(attempt, config, prev_delay)
                 continue
             else:
                 logger.error(
@@ -143,23 +220,83 @@ async def retry_request(
         raise RuntimeError("Retry logic failed unexpectedly")
 
 
-async def _delay_before_retry(attempt: int, config: RetryConfig):
-    """Calculate and apply delay before retry."""
-    # Exponential backoff: base_delay * (backoff_factor ^ attempt)
-    delay = config.base_delay * (config.backoff_factor ** attempt)
-    
-    # Cap at max_delay
-    delay = min(delay, config.max_delay)
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into a delay in seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Non-negative delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+async def _delay_before_retry(attempt: int, config: RetryConfig, prev_delay: float) -> float:
+    """
+    Calculate and apply delay before retry.
+
+    With jitter enabled this uses "decorrelated jitter": each delay is drawn
+    between base_delay and three times the previous delay, so concurrent
+    clients spread their retries out instead of retrying in lockstep.
+
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        config: Retry configuration
+        prev_delay: Delay applied before the previous retry (base_delay initially)
+
+    Returns:
+        The delay that was applied, to pass in as prev_delay next time
+    """
+    # Exponential backoff ceiling, precomputed per attempt by RetryConfig
+    cap = config._delay_schedule[attempt]
     
-    # Add jitter if enabled
     if config.jitter:
-        # Add random jitter of ±25% of the delay
-        jitter_range = delay * 0.25
-        delay += random.uniform(-jitter_range, jitter_range)
-        delay = max(0.1, delay)  # Minimum 100ms delay
+        upper = max(config.base_delay, prev_delay * 3)
+        delay = min(cap, config.base_delay + random.random() * (upper - config.base_delay))
+    else:
+        delay = cap
     
-    logger.debug(f"Waiting {delay:.2f}s before retry")
+    logger.debug("Waiting %.2fs before retry", delay)
     await asyncio.sleep(delay)
+    return delay
+
+
+def _freeze(value: Any) -> Any:
+    """Turn a params/headers argument into a hashable value."""
+    if value is None or isinstance(value, (str, bytes)):
+        return value
+    items = value.items() if hasattr(value, 'items') else value
+    return tuple(sorted((str(k), str(v)) for k, v in items))
+
+
+def _inflight_key(
+    service_type: 'ServiceType',
+    url: Union[str, httpx.URL],
+    retry_config: Optional[RetryConfig],
+    kwargs: Dict[str, Any]
+) -> Optional[tuple]:
+    """Build the coalescing key for a GET, or None if the request cannot be shared."""
+    if retry_config is not None or not set(kwargs) <= {'params', 'headers'}:
+        return None
+    try:
+        key = (service_type, str(url), _freeze(kwargs.get('params')), _freeze(kwargs.get('headers')))
+        hash(key)
+    except (TypeError, ValueError):
+        return None
+    return key
 
 
 class ServiceType(Enum):
@@ -171,6 +308,59 @@ class ServiceType(Enum):
     PANDOC = "pandoc"
 
 
+# Services that handle many concurrent requests and benefit from multiplexing
+# several streams over one HTTP/2 connection. HTTP/2 is negotiated via TLS
+# ALPN, so plain-http endpoints keep speaking HTTP/1.1 regardless.
+SERVICE_HTTP2: Dict[ServiceType, bool] = {
+    ServiceType.DEFAULT: False,
+    ServiceType.UNSTRUCTURED_IO: True,
+    ServiceType.LIBREOFFICE: False,
+    ServiceType.GOTENBERG: True,
+    ServiceType.PANDOC: False,
+}
+
+# Whether httpx follows redirects itself. Conversion services answer directly,
+# so a redirect there is unexpected and is surfaced rather than followed; the
+# generic client follows them so a permanent redirect costs one extra hop
+# instead of a second application-level request.
+SERVICE_FOLLOW_REDIRECTS: Dict[ServiceType, bool] = {
+    ServiceType.DEFAULT: True,
+    ServiceType.UNSTRUCTURED_IO: False,
+    ServiceType.LIBREOFFICE: False,
+    ServiceType.GOTENBERG: False,
+    ServiceType.PANDOC: False,
+}
+
+
+# Plain values that compare and hash by value, safe to use in a cache key
+_CACHEABLE_SCALARS = (type(None), bool, int, float, str, bytes, ServiceType)
+# httpx config objects that are unhashable but have a value-based repr
+_VALUE_REPR_TYPES = (httpx.Timeout, httpx.Limits)
+
+
+def _override_key_part(value: Any) -> Optional[tuple]:
+    """
+    Turn an override value into a value-based cache key component.
+
+    Returns None for anything whose identity rather than its value would
+    end up in the key (transports, auth objects, event hooks, callables),
+    since every fresh instance would otherwise add a client to the cache.
+    """
+    if isinstance(value, _CACHEABLE_SCALARS):
+        return ('v', value)
+    if isinstance(value, _VALUE_REPR_TYPES):
+        return ('r', repr(value))
+    if isinstance(value, (tuple, list)):
+        parts = [_override_key_part(item) for item in value]
+        return None if None in parts else ('s', tuple(parts))
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            return None
+        parts = [(k, _override_key_part(v)) for k, v in sorted(value.items())]
+        return None if any(part is None for _, part in parts) else ('m', tuple(parts))
+    return None
+
+
 class HTTPClientFactory:
     """
     Centralized factory for creating and managing HTTP clients.
@@ -181,51 +371,85 @@ class HTTPClientFactory:
 
     def __init__(self):
         self._clients: Dict[ServiceType, httpx.AsyncClient] = {}
-        self._limits = None
-        self._transport = None
-        self._timeout = None
-        self._retry_config = None
-
-    def _get_connection_limits(self) -> httpx.Limits:
-        """Get optimized connection limits for Docker networking."""
-        if self._limits is None:
-            self._limits = httpx.Limits(
-                max_keepalive_connections=20,  # Keep connections alive
-                max_connections=100,           # Total connection limit
-                keepalive_expiry=30.0          # Keep connections alive for 30s
-            )
-        return self._limits
-
-    def _get_transport(self) -> httpx.AsyncHTTPTransport:
-        """Get transport with Docker networking optimizations."""
-        if self._transport is None:
-            self._transport = httpx.AsyncHTTPTransport(limits=self._get_connection_limits())
-        return self._transport
-
-    def _get_timeout(self) -> httpx.Timeout:
-        """Get timeout configuration from environment or defaults."""
-        if self._timeout is None:
-            # Get timeout from environment variable or set default (None = no timeout)
-            http_timeout_str = os.getenv('APPLITEXTRAC_HTTP_TIMEOUT', '')
-            if not http_timeout_str.strip():
-                http_timeout = None  # No timeout
-                os.environ['APPLITEXTRAC_HTTP_TIMEOUT'] = ''
-            else:
-                http_timeout = float(http_timeout_str)
-
-            self._timeout = httpx.Timeout(
-                connect=5.0,
-                read=http_timeout,
-                write=300.0,
-                pool=5.0
+        # Clients built with custom overrides, keyed by service type and overrides
+        self._override_clients: Dict[tuple, httpx.AsyncClient] = {}
+        # In-flight GET requests, so concurrent identical GETs share one upstream call
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+        # Connection limits optimized for Docker networking
+        self._limits = httpx.Limits(
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,  # Keep connections alive
+            max_connections=HTTP_MAX_CONNECTIONS,          # Total connection limit
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY         # Keep connections alive for 30s
+        )
+        # HTTP/2 only where the service opts in and the h2 package is installed
+        self._service_http2: Dict[ServiceType, bool] = {
+            service_type: enabled and HTTP2_AVAILABLE
+            for service_type, enabled in SERVICE_HTTP2.items()
+        }
+        # Per-service pools so a slow service cannot starve the others. Sizes
+        # do not shrink for HTTP/2: the backends are plain http, so ALPN never
+        # negotiates h2 and every request still needs its own HTTP/1.1 connection.
+        document_limits = httpx.Limits(
+            max_keepalive_connections=8,   # Long-lived per-document calls
+            max_connections=16,
+            keepalive_expiry=60.0
+        )
+        self._service_limits: Dict[ServiceType, httpx.Limits] = {
+            ServiceType.DEFAULT: self._limits,
+            ServiceType.LIBREOFFICE: document_limits,
+            ServiceType.GOTENBERG: document_limits,
+            # Short, highly concurrent parsing calls (also serves pandoc/pyconvert)
+            ServiceType.UNSTRUCTURED_IO: httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=128,
+                keepalive_expiry=15.0
+            ),
+            ServiceType.PANDOC: self._limits,
+        }
+        # One transport (connection pool) per service type
+        self._transports: Dict[ServiceType, httpx.AsyncHTTPTransport] = {
+            service_type: httpx.AsyncHTTPTransport(
+                limits=limits,
+                http2=self._service_http2[service_type],
+                retries=1  # Retry failed connection attempts once
             )
-        return self._timeout
+            for service_type, limits in self._service_limits.items()
+        }
+        self._timeout = httpx.Timeout(
+            connect=5.0,
+            read=HTTP_READ_TIMEOUT,
+            write=300.0,
+            pool=5.0
+        )
+        self._retry_config = _DEFAULT_RETRY
+        # One retry logger per service, built once rather than on every request
+        self._loggers: Dict[ServiceType, logging.Logger] = {
+            service_type: logging.getLogger(f"{__name__}.{service_type.value}")
+            for service_type in ServiceType
+        }
 
-    def _get_retry_config(self) -> RetryConfig:
-        """Get retry configuration from environment or defaults."""
-        if self._retry_config is None:
-            self._retry_config = RetryConfig.from_env()
-        return self._retry_config
+        # Service-specific timeouts
+        self._service_timeouts: Dict[ServiceType, httpx.Timeout] = {
+            ServiceType.DEFAULT: self._timeout,
+            # LibreOffice may need longer timeouts for document processing
+            ServiceType.LIBREOFFICE: httpx.Timeout(
+                connect=10.0,
+                read=HTTP_READ_TIMEOUT,
+                write=600.0,  # Longer write timeout for large documents
+                pool=10.0
+            ),
+            # Gotenberg handles PDF generation which can be resource intensive
+            ServiceType.GOTENBERG: httpx.Timeout(
+                connect=10.0,
+                read=HTTP_READ_TIMEOUT,
+                write=600.0,  # Longer write timeout for PDF generation
+                pool=10.0
+            ),
+            # Unstructured.io handles document parsing
+            ServiceType.UNSTRUCTURED_IO: self._timeout,
+            ServiceType.PANDOC: self._timeout,
+        }
 
     def create_client(
         self,
@@ -235,6 +459,11 @@ class HTTPClientFactory:
         """
         Create an HTTP client with service-specific optimizations.
 
+        Clients are cached: one per service type, plus one per distinct set
+        of overrides, so repeated calls reuse the same keep-alive pool. Overrides
+        that can only be compared by identity (transports, auth objects, event
+        hooks, ...) produce an uncached client, which the caller must close.
+
         Args:
             service_type: Type of service the client will be used for
             **overrides: Override default client configuration
@@ -242,55 +471,48 @@ class HTTPClientFactory:
         Returns:
             Configured AsyncClient instance
         """
-        # Base configuration
+        cache_key = None
+        if overrides:
+            key_parts = _override_key_part(overrides)
+            if key_parts is not None:
+                cache_key = (service_type, key_parts)
+            existing = self._override_clients.get(cache_key) if cache_key else None
+        else:
+            existing = self._clients.get(service_type)
+        if existing is not None and not existing.is_closed:
+            return existing
+
         config = {
-            'timeout': self._get_timeout(),
-            'transport': self._get_transport(),
-            'follow_redirects': False,  # Disable automatic redirects to reduce latency
+            'timeout': self._service_timeouts[service_type],
+            'transport': self._transports[service_type],
+            'follow_redirects': SERVICE_FOLLOW_REDIRECTS[service_type],
         }
 
-        # Service-specific optimizations
-        if service_type == ServiceType.LIBREOFFICE:
-            # LibreOffice may need longer timeouts for document processing
-            config['timeout'] = httpx.Timeout(
-                connect=10.0,
-                read=self._get_timeout().read,
-                write=600.0,  # Longer write timeout for large documents
-                pool=10.0
-            )
-        elif service_type == ServiceType.GOTENBERG:
-            # Gotenberg handles PDF generation which can be resource intensive
-            config['timeout'] = httpx.Timeout(
-                connect=10.0,
-                read=self._get_timeout().read,
-                write=600.0,  # Longer write timeout for PDF generation
-                pool=10.0
-            )
-        elif service_type == ServiceType.UNSTRUCTURED_IO:
-            # Unstructured.io handles document parsing
-            config['timeout'] = httpx.Timeout(
-                connect=5.0,
-                read=self._get_timeout().read,
-                write=300.0,
-                pool=5.0
-            )
-
         # Apply overrides
         config.update(overrides)
 
         client = httpx.AsyncClient(**config)
-        self._clients[service_type] = client
+        if overrides:
+            if cache_key is not None:
+                self._override_clients[cache_key] = client
+        else:
+            self._clients[service_type] = client
         return client
 
+    def get_or_create_client(self, service_type: ServiceType = ServiceType.DEFAULT) -> httpx.AsyncClient:
+        """Get the shared client for a service type, creating it on first use."""
+        return self.create_client(service_type)
+
     async def close_all_clients(self):
         """Close all managed clients."""
-        for client in self._clients.values():
+        for client in [*self._clients.values(), *self._override_clients.values()]:
             try:
                 await client.aclose()
             except Exception as e:
                 logger.warning(f"Error closing HTTP client: {e}")
 
         self._clients.clear()
+        self._override_clients.clear()
 
     def get_client(self, service_type: ServiceType) -> Optional[httpx.AsyncClient]:
         """Get an existing client for a service type."""
@@ -300,7 +522,7 @@ class HTTPClientFactory:
         self,
         service_type: ServiceType,
         method: str,
-        url: str,
+        url: Union[str, httpx.URL],
         retry_config: Optional[RetryConfig] = None,
         **kwargs
     ) -> httpx.Response:
@@ -310,21 +532,23 @@ class HTTPClientFactory:
         Args:
             service_type: Type of service being called
             method: HTTP method (GET, POST, etc.)
-            url: Request URL
+            url: Request URL; pass a prebuilt httpx.URL to skip re-parsing
             retry_config: Optional retry configuration override
             **kwargs: Additional arguments for the request
             
         Returns:
             HTTP response
         """
-        client = self.get_client(service_type)
-        if client is None:
-            client = self.create_client(service_type)
+        client = self.get_or_create_client(service_type)
         
         if retry_config is None:
-            retry_config = self._get_retry_config()
+            retry_config = self._retry_config
+        
+        # Retries disabled: skip the retry machinery entirely
+        if retry_config.max_attempts <= 1:
+            return await client.request(method, url, **kwargs)
         
-        logger = logging.getLogger(f"{__name__}.{service_type.value}")
+        logger = self._loggers[service_type]
         
         async def _make_request():
             return await client.request(method, url, **kwargs)
@@ -334,17 +558,35 @@ class HTTPClientFactory:
     async def get_with_retry(
         self,
         service_type: ServiceType,
-        url: str,
+        url: Union[str, httpx.URL],
         retry_config: Optional[RetryConfig] = None,
         **kwargs
     ) -> httpx.Response:
-        """Make a GET request with retry logic."""
-        return await self.request_with_retry(service_type, "GET", url, retry_config, **kwargs)
+        """
+        Make a GET request with retry logic.
+
+        Concurrent identical GETs (same service, URL, params and headers, no
+        other options) are coalesced: only the first goes upstream and every
+        caller receives the same response.
+        """
+        key = _inflight_key(service_type, url, retry_config, kwargs)
+        if key is None:
+            return await self.request_with_retry(service_type, "GET", url, retry_config, **kwargs)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.request_with_retry(service_type, "GET", url, retry_config, **kwargs)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled does not cancel the shared request
+        return await asyncio.shield(task)
 
     async def post_with_retry(
         self,
         service_type: ServiceType,
-        url: str,
+        url: Union[str, httpx.URL],
         retry_config: Optional[RetryConfig] = None,
         **kwargs
     ) -> httpx.Response:
@@ -372,6 +614,8 @@ def create_service_client(service_type: ServiceType, **overrides) -> httpx.Async
     Returns:
         Configured AsyncClient
     """
+    if not overrides:
+        return _http_factory.get_or_create_client(service_type)
     return _http_factory.create_client(service_type, **overrides)
 
 
@@ -381,7 +625,11 @@ async def lifespan_http_clients():
     Context manager for HTTP client lifecycle management.
 
     Use this in FastAPI lifespan events to ensure proper client cleanup.
+    The shared client for every service type is created up front, so the
+    first request to a service does not pay for client construction.
     """
+    for service_type in ServiceType:
+        _http_factory.get_or_create_client(service_type)
     try:
         yield
     finally:
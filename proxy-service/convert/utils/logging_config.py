@@ -8,17 +8,35 @@ This module provides:
 - Utility functions for common logging patterns
 """
 
+import atexit
+import copy
+import json
 import logging
 import logging.handlers
 import sys
 import os
+import queue
+import threading
+import time
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
-from datetime import datetime
+from typing import Optional, Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 
 # ===== LOGGING CONFIGURATION =====
 
+# Whether we run under pytest, evaluated once at import
+_IS_TEST_ENV = 'pytest' in sys.modules or any(
+    key in os.environ for key in ('PYTEST_CURRENT_TEST', 'PYTEST_DISABLE_PLUGIN_AUTOLOAD')
+)
+
 class LogLevel:
     """Standard log levels with string representations."""
     DEBUG = logging.DEBUG
@@ -54,7 +72,11 @@ class LogConfig:
     # JSON format for production
     JSON_FORMAT = '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "message": "%(message)s"}'
 
+    # The environment getters below are cached: the environment is read once
+    # per process. Call e.g. LogConfig.get_log_level.cache_clear() to re-read.
+
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_log_level() -> int:
         """Get log level from environment or default to INFO (WARNING in tests)."""
         # Check for explicit log level from environment
@@ -73,32 +95,15 @@ class LogConfig:
 
     @staticmethod
     def _is_test_environment() -> bool:
-        """Detect if we're running in a test environment."""
-        import sys
-
-        # Check for pytest
-        if 'pytest' in sys.modules:
-            return True
+        """
+        Detect if we're running in a test environment.
 
-        # Check for common test environment indicators
-        if any(key in os.environ for key in ['PYTEST_CURRENT_TEST', 'PYTEST_DISABLE_PLUGIN_AUTOLOAD']):
-            return True
-
-        # Check if we're running test files
-        if hasattr(sys, '_getframe'):
-            try:
-                frame = sys._getframe(1)  # Get caller's frame
-                while frame:
-                    filename = frame.f_code.co_filename
-                    if 'test' in filename.lower() or 'conftest' in filename.lower():
-                        return True
-                    frame = frame.f_back
-            except (AttributeError, ValueError):
-                pass
-
-        return False
+        Set LOG_LEVEL explicitly if this module is imported before pytest loads.
+        """
+        return _IS_TEST_ENV
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_log_format() -> str:
         """Get log format based on environment."""
         format_type = os.getenv('LOG_FORMAT', 'standard').lower()
@@ -111,11 +116,13 @@ class LogConfig:
             return LogConfig.DEFAULT_FORMAT
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def should_log_to_file() -> bool:
         """Check if logging to file is enabled."""
         return os.getenv('LOG_TO_FILE', 'false').lower() in ('true', '1', 'yes')
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_log_file_path() -> Optional[Path]:
         """Get log file path from environment."""
         log_file = os.getenv('LOG_FILE')
@@ -123,14 +130,85 @@ class LogConfig:
             return Path(log_file)
         return None
 
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def get_formatter(log_format: str) -> logging.Formatter:
+        """
+        Get the shared formatter for a log format string.
+
+        Formatters are stateless, so one instance per format is built and
+        reused by every handler and every reconfiguration.
+
+        Args:
+            log_format: A %-style format string, or LogConfig.JSON_FORMAT
+
+        Returns:
+            A JSONFormatter for the JSON layout, otherwise a logging.Formatter
+        """
+        if log_format == LogConfig.JSON_FORMAT:
+            return JSONFormatter()
+        return logging.Formatter(log_format)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formatter that emits each record as one properly escaped JSON object.
+
+    Produces the fields described by LogConfig.JSON_FORMAT, plus the
+    traceback under "exception" when one is attached. Uses orjson when
+    available.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # Already rendered by _ExceptionPreservingQueueHandler before queueing
+            data["exception"] = record.exc_text
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, default=str).decode("utf-8")
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class _ExceptionPreservingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that keeps the traceback separate from the message.
+
+    The stock prepare() formats the whole record, traceback included, into
+    msg and drops exc_info, so formatters on the listener side (notably
+    JSONFormatter) never see the exception. Here the message is frozen on
+    its own and the traceback is kept as exc_text.
+    """
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            # Tracebacks hold frames alive; the rendered text is enough downstream
+            record.exc_info = None
+        return record
+
 
 # ===== LOGGER FACTORY =====
 
 class LoggerFactory:
     """Factory for creating pre-configured loggers."""
 
-    _loggers: Dict[str, logging.Logger] = {}
     _configured = False
+    _configure_lock = threading.Lock()
+    _listener: Optional[logging.handlers.QueueListener] = None
 
     @classmethod
     def configure_logging(cls, level: Optional[int] = None,
@@ -142,59 +220,83 @@ class LoggerFactory:
         if cls._configured:
             return  # Already configured
 
-        # Get configuration from environment or parameters
-        log_level = level or LogConfig.get_log_level()
-        log_format = format_str or LogConfig.get_log_format()
-        should_log_to_file = log_to_file or LogConfig.should_log_to_file()
-        log_file_path = Path(log_file) if log_file else LogConfig.get_log_file_path()
-
-        # Create formatter
-        formatter = logging.Formatter(log_format)
-
-        # Configure root logger
-        root_logger = logging.getLogger()
-        root_logger.setLevel(log_level)
-
-        # Remove existing handlers to avoid duplicates
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
-
-        # File handler (if enabled)
-        if should_log_to_file:
-            if log_file_path:
-                # Ensure directory exists
-                log_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Use rotating file handler for production
-                file_handler = logging.handlers.RotatingFileHandler(
-                    log_file_path,
-                    maxBytes=10*1024*1024,  # 10MB
-                    backupCount=5
-                )
-                file_handler.setLevel(log_level)
-                file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
-
-        cls._configured = True
+        with cls._configure_lock:
+            # Another thread may have finished configuring while we waited
+            if cls._configured:
+                return
+
+            # Get configuration from environment or parameters
+            log_level = level or LogConfig.get_log_level()
+            log_format = format_str or LogConfig.get_log_format()
+            should_log_to_file = log_to_file or LogConfig.should_log_to_file()
+            log_file_path = Path(log_file) if log_file else LogConfig.get_log_file_path()
+
+            # Shared formatter; the JSON layout gets a real encoder so messages are escaped
+            formatter = LogConfig.get_formatter(log_format)
+
+            # Configure root logger
+            root_logger = logging.getLogger()
+            root_logger.setLevel(log_level)
+
+            # Remove existing handlers to avoid duplicates
+            for handler in root_logger.handlers[:]:
+                root_logger.removeHandler(handler)
+
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(formatter)
+            output_handlers = [console_handler]
+
+            # File handler (if enabled)
+            if should_log_to_file:
+                if log_file_path:
+                    # Ensure directory exists
+                    log_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+                    # Use rotating file handler for production
+                    file_handler = logging.handlers.RotatingFileHandler(
+                        log_file_path,
+                        maxBytes=10*1024*1024,  # 10MB
+                        backupCount=5
+                    )
+                    file_handler.setLevel(log_level)
+                    file_handler.setFormatter(formatter)
+                    output_handlers.append(file_handler)
+
+            # Log calls only enqueue the record; a background thread does the
+            # (possibly blocking) stream and file writes off the event loop
+            log_queue = queue.SimpleQueue()
+            queue_handler = _ExceptionPreservingQueueHandler(log_queue)
+            queue_handler.setLevel(log_level)
+            root_logger.addHandler(queue_handler)
+
+            cls._listener = logging.handlers.QueueListener(
+                log_queue, *output_handlers, respect_handler_level=True
+            )
+            cls._listener.start()
+            atexit.register(cls.stop_listener)
+
+            cls._configured = True
+
+    @classmethod
+    def stop_listener(cls) -> None:
+        """Flush queued records and stop the background logging thread."""
+        if cls._listener is not None:
+            cls._listener.stop()
+            cls._listener = None
 
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
-        """Get or create a logger with the given name."""
-        if name not in cls._loggers:
-            # Ensure logging is configured
-            cls.configure_logging()
+        """Get or create a logger with the given name.
 
-            # Create logger
-            logger = logging.getLogger(name)
-            cls._loggers[name] = logger
+        ``logging.getLogger`` already caches loggers under the logging
+        module's own lock, so no separate registry is kept here.
+        """
+        if not cls._configured:
+            cls.configure_logging()
 
-        return cls._loggers[name]
+        return logging.getLogger(name)
 
     @classmethod
     def get_module_logger(cls) -> logging.Logger:
@@ -239,14 +341,18 @@ def setup_logging(level: Optional[Union[str, int]] = None,
 def log_function_call(logger: logging.Logger, level: int = logging.DEBUG):
     """Decorator to log function calls."""
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            logger.log(level, f"Calling {func.__name__} with args={args}, kwargs={kwargs}")
+            if not logger.isEnabledFor(level):
+                return func(*args, **kwargs)
+
+            logger.log(level, "Calling %s with args=%r, kwargs=%r", func.__name__, args, kwargs)
             try:
                 result = func(*args, **kwargs)
-                logger.log(level, f"{func.__name__} returned: {result}")
+                logger.log(level, "%s returned: %s", func.__name__, result)
                 return result
             except Exception as e:
-                logger.log(level, f"{func.__name__} raised exception: {e}")
+                logger.log(level, "%s raised exception: %s", func.__name__, e)
                 raise
         return wrapper
     return decorator
@@ -255,20 +361,23 @@ def log_function_call(logger: logging.Logger, level: int = logging.DEBUG):
 def log_performance(logger: logging.Logger, level: int = logging.INFO):
     """Decorator to log function performance."""
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = datetime.now()
-            logger.log(level, f"Starting {func.__name__}")
+            # Skip timing entirely when the records would be dropped
+            if not logger.isEnabledFor(level):
+                return func(*args, **kwargs)
+
+            start_time = time.perf_counter()
+            logger.log(level, "Starting %s", func.__name__)
 
             try:
                 result = func(*args, **kwargs)
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.log(level, f"Completed {func.__name__} in {duration:.3f}s")
+                duration = time.perf_counter() - start_time
+                logger.log(level, "Completed %s in %.3fs", func.__name__, duration)
                 return result
             except Exception as e:
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                logger.log(level, f"Failed {func.__name__} after {duration:.3f}s: {e}")
+                duration = time.perf_counter() - start_time
+                logger.log(level, "Failed %s after %.3fs: %s", func.__name__, duration, e)
                 raise
         return wrapper
     return decorator
@@ -7,16 +7,36 @@ multiple detection methods with consistent priority ordering and fallbacks.
 
 import logging
 import mimetypes
-from pathlib import Path
-from typing import Optional, Union, Tuple
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, List, Optional, Union, Tuple
 
-# Try to import python-magic for content-based detection
+# Content-based detection prefers puremagic (pure Python, header signatures
+# only) and falls back to python-magic, which needs the libmagic C library
 try:
-    import magic
-    MAGIC_AVAILABLE = True
+    import puremagic
+    PUREMAGIC_AVAILABLE = True
 except ImportError:
-    magic = None
-    MAGIC_AVAILABLE = False
+    puremagic = None
+    PUREMAGIC_AVAILABLE = False
+
+# python-magic loads libmagic and its signature database on import, so it is
+# only imported the first time content reaches the magic fallback
+_NOT_LOADED = object()
+_magic = _NOT_LOADED
+
+
+def _get_magic():
+    """Import python-magic on first use; returns None if it is unavailable."""
+    global _magic
+    if _magic is _NOT_LOADED:
+        try:
+            import magic
+            _magic = magic
+        except ImportError:
+            _magic = None
+    return _magic
 
 # Import centralized logging configuration
 from .logging_config import get_logger
@@ -24,59 +44,252 @@ from .logging_config import get_logger
 # Set up logging
 logger = get_logger()
 
-# Comprehensive MIME type mappings for common document formats
-MIME_TYPE_MAPPINGS = {
-    # Document formats
-    "pdf": "application/pdf",
-    "doc": "application/msword",
-    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    "xls": "application/vnd.ms-excel",
-    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    "ppt": "application/vnd.ms-powerpoint",
-    "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-    "odt": "application/vnd.oasis.opendocument.text",
-    "ods": "application/vnd.oasis.opendocument.spreadsheet",
-    "odp": "application/vnd.oasis.opendocument.presentation",
-    "rtf": "application/rtf",
-
-    # Text formats
-    "txt": "text/plain",
-    "html": "text/html",
-    "htm": "text/html",
-    "md": "text/markdown",
-    "tex": "application/x-tex",
-    "latex": "application/x-latex",
-
-    # Apple formats
-    "pages": "application/vnd.apple.pages",
-    "numbers": "application/vnd.apple.numbers",
-    "key": "application/vnd.apple.keynote",
-
-    # Email formats
-    "eml": "message/rfc822",
-    "msg": "application/vnd.ms-outlook",
-
-    # Archive formats
-    "zip": "application/zip",
-    "rar": "application/x-rar-compressed",
-
-    # Image formats (for OCR/document processing)
-    "png": "image/png",
-    "jpg": "image/jpeg",
-    "jpeg": "image/jpeg",
-    "gif": "image/gif",
-    "bmp": "image/bmp",
-    "tiff": "image/tiff",
-    "tif": "image/tiff",
-
-    # JSON and structured data
-    "json": "application/json",
-    "xml": "application/xml",
-    "csv": "text/csv",
-}
+# Comprehensive (format, MIME type) pairs for common document formats. Where
+# several formats share a MIME type, the first one listed is preferred.
+_FORMAT_MIME_PAIRS = tuple(
+    (sys.intern(format_name), sys.intern(mime_type))
+    for format_name, mime_type in (
+        # Document formats
+        ("pdf", "application/pdf"),
+        ("doc", "application/msword"),
+        ("docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+        ("xls", "application/vnd.ms-excel"),
+        ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+        ("ppt", "application/vnd.ms-powerpoint"),
+        ("pptx", "application/vnd.openxmlformats-officedocument.presentationml.presentation"),
+        ("odt", "application/vnd.oasis.opendocument.text"),
+        ("ods", "application/vnd.oasis.opendocument.spreadsheet"),
+        ("odp", "application/vnd.oasis.opendocument.presentation"),
+        ("rtf", "application/rtf"),
+
+        # Text formats
+        ("txt", "text/plain"),
+        ("html", "text/html"),
+        ("htm", "text/html"),
+        ("md", "text/markdown"),
+        ("tex", "application/x-tex"),
+        ("latex", "application/x-latex"),
+
+        # Apple formats
+        ("pages", "application/vnd.apple.pages"),
+        ("numbers", "application/vnd.apple.numbers"),
+        ("key", "application/vnd.apple.keynote"),
+
+        # Email formats
+        ("eml", "message/rfc822"),
+        ("msg", "application/vnd.ms-outlook"),
+
+        # Archive formats
+        ("zip", "application/zip"),
+        ("rar", "application/x-rar-compressed"),
+
+        # Image formats (for OCR/document processing)
+        ("png", "image/png"),
+        ("jpg", "image/jpeg"),
+        ("jpeg", "image/jpeg"),
+        ("gif", "image/gif"),
+        ("bmp", "image/bmp"),
+        ("tiff", "image/tiff"),
+        ("tif", "image/tiff"),
+
+        # JSON and structured data
+        ("json", "application/json"),
+        ("xml", "application/xml"),
+        ("csv", "text/csv"),
+    )
+)
+
+# Format -> MIME type (read-only)
+MIME_TYPE_MAPPINGS = MappingProxyType(dict(_FORMAT_MIME_PAIRS))
+
+
+def _build_content_type_to_format() -> MappingProxyType:
+    """Build the reverse MIME type -> format table, keeping the first format per MIME type."""
+    reverse = {}
+    for format_name, mime_type in _FORMAT_MIME_PAIRS:
+        reverse.setdefault(mime_type, format_name)
+    return MappingProxyType(reverse)
+
 
 # Reverse mapping for content-type to format detection
-CONTENT_TYPE_TO_FORMAT = {v: k for k, v in MIME_TYPE_MAPPINGS.items()}
+CONTENT_TYPE_TO_FORMAT = _build_content_type_to_format()
+
+# Detected MIME types that content sniffing is known to get wrong, mapped to
+# the expected formats for which the mapping table should win instead
+# OLE2 compound files (legacy doc/xls/ppt/msg) only tell their kind apart in the
+# directory stream, which may sit anywhere in the file, so a header sniff cannot
+OLE2_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+OLE2_MIME_TYPE = "application/x-ole-storage"
+_OLE2_GENERIC_TYPES = frozenset({OLE2_MIME_TYPE, "application/CDFV2", "application/x-cfb"})
+
+_OVERRIDE_CASES = MappingProxyType({
+    "text/plain": frozenset({"html", "md", "tex", "latex"}),
+    "application/octet-stream": frozenset({"pdf", "docx", "xlsx", "pptx"}),
+    # Office/OpenDocument files are zip containers; a header-only sniff
+    # may not see far enough to tell them apart from a plain archive
+    "application/zip": frozenset({"docx", "xlsx", "pptx", "odt", "ods", "odp"}),
+    # Legacy Office files share the OLE2 compound file container
+    OLE2_MIME_TYPE: frozenset({"doc", "xls", "ppt", "msg"}),
+})
+
+# File signatures live in the first few KiB, so only that much is sniffed
+MAGIC_HEADER_SIZE = 8192
+
+
+# Signatures of the most common inputs, checked before any magic library
+_FAST_SIGNATURES = (
+    (b"%PDF-", "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+    (b"{\\rtf", "application/rtf"),
+)
+
+# Top-level folders that identify an OOXML package inside a zip
+_OOXML_MARKERS = (
+    (b"word/", MIME_TYPE_MAPPINGS["docx"]),
+    (b"xl/", MIME_TYPE_MAPPINGS["xlsx"]),
+    (b"ppt/", MIME_TYPE_MAPPINGS["pptx"]),
+)
+
+_ODF_MIME_PREFIX = "application/vnd.oasis.opendocument."
+
+_ZIP_LOCAL_HEADER = b"PK\x03\x04"
+_ZIP_LOCAL_HEADER_SIZE = 30
+
+
+def _ooxml_mime_type(header: bytes) -> Optional[str]:
+    """
+    Walk the zip local file headers in ``header`` looking for an OOXML part.
+
+    Only entry names are compared, so compressed data that happens to contain
+    "xl/" and similar cannot cause a false match.
+
+    Args:
+        header: Leading bytes of a zip file
+
+    Returns:
+        The docx/xlsx/pptx MIME type, or None if no OOXML part was seen
+    """
+    position = 0
+    while True:
+        position = header.find(_ZIP_LOCAL_HEADER, position)
+        if position == -1 or position + _ZIP_LOCAL_HEADER_SIZE > len(header):
+            return None
+
+        flags = int.from_bytes(header[position + 6:position + 8], "little")
+        compressed_size = int.from_bytes(header[position + 18:position + 22], "little")
+        name_length = int.from_bytes(header[position + 26:position + 28], "little")
+        extra_length = int.from_bytes(header[position + 28:position + 30], "little")
+
+        name_start = position + _ZIP_LOCAL_HEADER_SIZE
+        name = header[name_start:name_start + name_length]
+        for marker, mime_type in _OOXML_MARKERS:
+            if name.startswith(marker):
+                return mime_type
+
+        position = name_start + name_length
+        # Bit 3 means sizes follow the data, so scan for the next header instead
+        if not flags & 0x08:
+            position += extra_length + compressed_size
+
+
+def _sniff_zip(header: bytes) -> str:
+    """
+    Tell office documents apart from plain zip archives.
+
+    Args:
+        header: Leading bytes of a zip file
+
+    Returns:
+        The ODF or OOXML MIME type if recognised, otherwise application/zip
+    """
+    # ODF stores its MIME type uncompressed as the first entry, "mimetype"
+    if header[30:38] == b"mimetype":
+        name_length = int.from_bytes(header[26:28], "little")
+        extra_length = int.from_bytes(header[28:30], "little")
+        size = int.from_bytes(header[18:22], "little")
+        start = 30 + name_length + extra_length
+        mime_type = header[start:start + size].decode("ascii", "ignore")
+        if mime_type.startswith(_ODF_MIME_PREFIX):
+            return mime_type
+
+    return _ooxml_mime_type(header) or "application/zip"
+
+
+def _sniff_mime_type(content: bytes) -> Optional[str]:
+    """
+    Identify content by its leading bytes.
+
+    Common formats are matched against a few fixed signatures first; anything
+    else goes to puremagic or python-magic.
+
+    Args:
+        content: Raw file content bytes
+
+    Returns:
+        MIME type string, or None if no signature matched
+    """
+    header = content[:MAGIC_HEADER_SIZE]
+
+    for signature, mime_type in _FAST_SIGNATURES:
+        if header.startswith(signature):
+            return mime_type
+    if header.startswith(b"PK\x03\x04"):
+        return _sniff_zip(header)
+    if header.startswith(OLE2_SIGNATURE):
+        return _sniff_ole2(content)
+    # Markup may be preceded by a UTF-8 byte order mark or whitespace
+    head = header[:64].lstrip(b"\xef\xbb\xbf \t\r\n")[:14].lower()
+    if head.startswith(b"<!doctype html") or head.startswith(b"<html"):
+        return "text/html"
+
+    if PUREMAGIC_AVAILABLE:
+        try:
+            matches = puremagic.magic_string(header)
+        except puremagic.PureError:
+            matches = []
+        # Matches are ordered by confidence; some signatures carry no MIME type
+        for match in matches:
+            if match.mime_type:
+                return match.mime_type
+    magic = _get_magic()
+    if magic is not None:
+        return magic.from_buffer(header, mime=True)
+    return None
+
+
+def _sniff_ole2(content: bytes) -> str:
+    """
+    Identify an OLE2 compound file.
+
+    Signature tables such as puremagic's report every OLE2 file as its first
+    OLE match (application/msword). libmagic parses the container, but needs
+    the whole file rather than the header. Without it, the generic container
+    type is returned so the extension or expected format can decide.
+
+    Args:
+        content: Raw file content bytes
+
+    Returns:
+        Specific Office MIME type when libmagic recognises it, else OLE2_MIME_TYPE
+    """
+    magic = _get_magic()
+    if magic is not None:
+        mime_type = magic.from_buffer(content, mime=True)
+        if mime_type and mime_type not in _OLE2_GENERIC_TYPES:
+            return mime_type
+    return OLE2_MIME_TYPE
+
+
+@lru_cache(maxsize=256)
+def _format_for_mime_type(mime_type: str) -> Optional[str]:
+    """Map a raw MIME type (possibly with parameters) to a format via CONTENT_TYPE_TO_FORMAT."""
+    # Clean up MIME type (remove charset, etc.)
+    mime_clean = mime_type.partition(";")[0].strip().lower()
+
+    # Look up in reverse mapping
+    return CONTENT_TYPE_TO_FORMAT.get(mime_clean)
 
 
 class MimeTypeDetector:
@@ -84,7 +297,7 @@ class MimeTypeDetector:
     Unified MIME type detector with multiple detection methods and consistent fallbacks.
 
     Detection priority order:
-    1. Content-based detection (python-magic) - most accurate
+    1. Content-based detection (puremagic or python-magic) - most accurate
     2. Extension-based detection (mimetypes module)
     3. Custom mappings and overrides
     4. Generic fallbacks
@@ -92,12 +305,20 @@ class MimeTypeDetector:
 
     def __init__(self):
         """Initialize the MIME type detector."""
-        # Initialize mimetypes with additional mappings
-        mimetypes.init()
+        # Extension (with dot) -> MIME type, resolved once so lookups skip
+        # the mimetypes machinery; the custom mappings take precedence.
+        # The stdlib's built-in table is used as-is: calling mimetypes.init()
+        # would only add system mime.types entries at the cost of disk I/O,
+        # and nothing else here goes through mimetypes.guess_type.
+        self._ext_to_mime = {
+            **mimetypes.types_map,
+            **{f".{ext}": mime_type for ext, mime_type in MIME_TYPE_MAPPINGS.items()},
+        }
 
-        # Add custom MIME type mappings
-        for ext, mime_type in MIME_TYPE_MAPPINGS.items():
-            mimetypes.add_type(mime_type, f".{ext}")
+        # Per-instance memoization of the pure lookups; the same handful of
+        # extensions and formats recur across requests
+        self._mime_for_extension = lru_cache(maxsize=512)(self._lookup_extension)
+        self._fallback_mime_type = lru_cache(maxsize=256)(self._resolve_fallback_mime_type)
 
     def detect_from_content(
         self,
@@ -106,7 +327,7 @@ class MimeTypeDetector:
         expected_format: Optional[str] = None
     ) -> str:
         """
-        Detect MIME type from file content using python-magic.
+        Detect MIME type from the file's leading bytes (puremagic or python-magic).
 
         Args:
             content: Raw file content bytes
@@ -116,32 +337,37 @@ class MimeTypeDetector:
         Returns:
             Detected MIME type string
         """
-        if not MAGIC_AVAILABLE or not content:
+        if not content:
             return None
 
         try:
-            # Use python-magic for content-based detection
-            detected_mime = magic.from_buffer(content, mime=True)
+            detected_mime = _sniff_mime_type(content)
 
             if detected_mime:
                 # Apply format-specific overrides
                 if expected_format and self._should_override_magic(detected_mime, expected_format):
                     override_mime = MIME_TYPE_MAPPINGS.get(expected_format)
                     if override_mime:
-                        logger.debug(f"Overriding magic detection {detected_mime} -> {override_mime} for format {expected_format}")
+                        logger.debug("Overriding magic detection %s -> %s for format %s", detected_mime, override_mime, expected_format)
                         return override_mime
 
-                logger.debug(f"Content-based detection: {detected_mime}")
+                if detected_mime == OLE2_MIME_TYPE and filename:
+                    # The container alone says nothing; a known extension does
+                    extension_mime = self.detect_from_extension(filename)
+                    if extension_mime:
+                        return extension_mime
+
+                logger.debug("Content-based detection: %s", detected_mime)
                 return detected_mime
 
         except Exception as e:
-            logger.debug(f"Content-based detection failed: {e}")
+            logger.debug("Content-based detection failed: %s", e)
 
         return None
 
     def detect_from_extension(self, filename: str) -> str:
         """
-        Detect MIME type from file extension using mimetypes module.
+        Detect MIME type from file extension using the precomputed extension table.
 
         Args:
             filename: Filename or extension
@@ -152,31 +378,30 @@ class MimeTypeDetector:
         if not filename:
             return None
 
-        try:
-            # Extract extension if full path provided
-            if "/" in filename or "\\" in filename:
-                filename = Path(filename).name
-
-            # Remove leading dot if present
-            if filename.startswith("."):
-                extension = filename[1:]
-            else:
-                extension = Path(filename).suffix[1:].lower()
-
-            if not extension:
-                return None
-
-            # Use mimetypes for extension-based detection
-            mime_type, _ = mimetypes.guess_type(f"file.{extension}")
+        extension = self._extension_of(filename)
+        if not extension:
+            return None
+        return self._mime_for_extension(extension)
+
+    @staticmethod
+    def _extension_of(filename: str) -> Optional[str]:
+        """Return the lower-cased text after the last dot of the base name, if any."""
+        # Strip any directory part, then take the text after the last dot
+        name = filename.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+        dot = name.rfind(".")
+        if dot == -1:
+            return None
+        return name[dot + 1:].lower()
 
-            if mime_type:
-                # Handle special cases
-                mime_type = self._normalize_mime_type(mime_type, extension)
-                logger.debug(f"Extension-based detection: {extension} -> {mime_type}")
-                return mime_type
+    def _lookup_extension(self, extension: str) -> Optional[str]:
+        """Map a normalized extension to its MIME type (memoized per instance)."""
+        mime_type = self._ext_to_mime.get(f".{extension}")
 
-        except Exception as e:
-            logger.debug(f"Extension-based detection failed: {e}")
+        if mime_type:
+            # Handle special cases
+            mime_type = self._normalize_mime_type(mime_type, extension)
+            logger.debug("Extension-based detection: %s -> %s", extension, mime_type)
+            return mime_type
 
         return None
 
@@ -199,7 +424,7 @@ class MimeTypeDetector:
         # Look up in custom mappings
         mime_type = MIME_TYPE_MAPPINGS.get(format_clean.lower())
         if mime_type:
-            logger.debug(f"Mapping-based detection: {format_clean} -> {mime_type}")
+            logger.debug("Mapping-based detection: %s -> %s", format_clean, mime_type)
             return mime_type
 
         return None
@@ -223,34 +448,68 @@ class MimeTypeDetector:
         Returns:
             MIME type string with fallback to application/octet-stream
         """
-        detected_mime = None
+        if filename:
+            lookup_extension = self._extension_of(filename)
+        else:
+            lookup_extension = extension and self._extension_of(f"file.{extension}")
+
+        detected_mime = (
+            # Method 1: Content-based detection (most accurate)
+            (content and self.detect_from_content(content, filename, expected_format))
+            # Methods 2-4 only depend on the extension, so they are memoized
+            or self._fallback_mime_type(lookup_extension or None, extension, expected_format)
+        )
+        logger.debug("Final MIME type detection: %s", detected_mime)
+        return detected_mime
+
+    def get_mime_types_batch(
+        self,
+        items: Iterable[Tuple[Optional[bytes], Optional[str], Optional[str], Optional[str]]]
+    ) -> List[str]:
+        """
+        Get MIME types for many files at once.
 
-        # Method 1: Content-based detection (most accurate)
-        if content:
-            detected_mime = self.detect_from_content(content, filename, expected_format)
+        Equivalent to calling get_mime_type for each item, with the per-call
+        method lookups hoisted out of the loop.
 
-        # Method 2: Extension-based detection
-        if not detected_mime:
+        Args:
+            items: (content, filename, extension, expected_format) tuples
+
+        Returns:
+            One MIME type per item, in order
+        """
+        detect_from_content = self.detect_from_content
+        extension_of = self._extension_of
+        fallback_mime_type = self._fallback_mime_type
+
+        results = []
+        append = results.append
+        for content, filename, extension, expected_format in items:
             if filename:
-                detected_mime = self.detect_from_extension(filename)
-            elif extension:
-                detected_mime = self.detect_from_extension(f"file.{extension}")
-
-        # Method 3: Custom mapping fallback
-        if not detected_mime:
-            lookup_key = expected_format or extension
-            if lookup_key:
-                detected_mime = self.detect_from_mapping(lookup_key)
-
-        # Method 4: Generic fallback
-        if not detected_mime:
-            if expected_format:
-                detected_mime = f"application/{expected_format}"
+                lookup_extension = extension_of(filename)
             else:
-                detected_mime = "application/octet-stream"
-
-        logger.debug(f"Final MIME type detection: {detected_mime}")
-        return detected_mime
+                lookup_extension = extension and extension_of(f"file.{extension}")
+            append(
+                (content and detect_from_content(content, filename, expected_format))
+                or fallback_mime_type(lookup_extension or None, extension, expected_format)
+            )
+        return results
+
+    def _resolve_fallback_mime_type(
+        self,
+        lookup_extension: Optional[str],
+        extension: Optional[str],
+        expected_format: Optional[str]
+    ) -> str:
+        """Resolve a MIME type without content (memoized per instance)."""
+        return (
+            # Method 2: Extension-based detection
+            (lookup_extension and self._mime_for_extension(lookup_extension))
+            # Method 3: Custom mapping fallback
+            or self.detect_from_mapping(expected_format or extension)
+            # Method 4: Generic fallback
+            or (f"application/{expected_format}" if expected_format else "application/octet-stream")
+        )
 
     def get_format_from_mime_type(self, mime_type: str) -> Optional[str]:
         """
@@ -265,11 +524,12 @@ class MimeTypeDetector:
         if not mime_type:
             return None
 
-        # Clean up MIME type (remove charset, etc.)
-        mime_clean = mime_type.lower().split(";")[0].strip()
+        # Fast path: already a bare, lower-case MIME type
+        format_name = CONTENT_TYPE_TO_FORMAT.get(mime_type)
+        if format_name is not None:
+            return format_name
 
-        # Look up in reverse mapping
-        return CONTENT_TYPE_TO_FORMAT.get(mime_clean)
+        return _format_for_mime_type(mime_type)
 
     def _should_override_magic(self, detected_mime: str, expected_format: str) -> bool:
         """
@@ -282,13 +542,7 @@ class MimeTypeDetector:
         Returns:
             True if override should be applied
         """
-        # Override cases where magic detection is known to be inaccurate
-        override_cases = {
-            "text/plain": ["html", "md", "tex", "latex"],
-            "application/octet-stream": ["pdf", "docx", "xlsx", "pptx"]
-        }
-
-        return expected_format in override_cases.get(detected_mime, [])
+        return expected_format in _OVERRIDE_CASES.get(detected_mime, frozenset())
 
     def _normalize_mime_type(self, mime_type: str, extension: str) -> str:
         """
@@ -311,14 +565,11 @@ class MimeTypeDetector:
         return mime_type
 
 
-# Global detector instance
-_detector_instance = None
+# Global detector instance, built at import so no lazy (racy) init is needed
+_detector_instance = MimeTypeDetector()
 
 def get_mime_detector() -> MimeTypeDetector:
     """Get the global MIME type detector instance."""
-    global _detector_instance
-    if _detector_instance is None:
-        _detector_instance = MimeTypeDetector()
     return _detector_instance
 
 def get_mime_type(
@@ -342,6 +593,20 @@ def get_mime_type(
     detector = get_mime_detector()
     return detector.get_mime_type(content, filename, extension, expected_format)
 
+def get_mime_types_batch(
+    items: Iterable[Tuple[Optional[bytes], Optional[str], Optional[str], Optional[str]]]
+) -> List[str]:
+    """
+    Convenience function to get MIME types for many files using the global detector.
+
+    Args:
+        items: (content, filename, extension, expected_format) tuples
+
+    Returns:
+        One MIME type per item, in order
+    """
+    return _detector_instance.get_mime_types_batch(items)
+
 def get_format_from_mime_type(mime_type: str) -> Optional[str]:
     """
     Convenience function to get format from MIME type.
@@ -0,0 +1,43 @@
+"""
+Fast JSON responses backed by orjson.
+
+orjson serializes several times faster than the standard library and handles
+datetime, UUID and Enum values natively. When orjson is not installed the
+response falls back to Starlette's standard JSON rendering.
+"""
+
+import json
+from typing import Any, Union
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(content: Any) -> bytes:
+    """Serialize content to compact JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def loads_json(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse JSON straight from bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders its content with orjson when available."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if not ORJSON_AVAILABLE:
+            return super().render(content)
+        return dumps_json(content)
@@ -5,19 +5,55 @@ This module contains custom conversion logic for special cases that don't
 follow the standard conversion patterns.
 """
 
-import json
+import asyncio
 import logging
 import os
 import tempfile
 from fastapi import HTTPException, Request
 from fastapi.responses import Response
 from io import BytesIO
-from typing import Any, Dict
+from typing import Any, AsyncIterator, BinaryIO, Dict
 
 from ..config import ConversionService
-from .conversion_core import _convert_file
+from .conversion_core import _convert_file, UPLOAD_SPOOL_MAX_SIZE
 from .unstructured_utils import process_unstructured_json_to_content
-from .temp_file_manager import get_temp_manager
+from .orjson_response import loads_json
+
+# Chunk size used when streaming a temp upload back from its file
+TEMP_UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class TempFileUpload:
+    """
+    UploadFile-like view of a binary file object.
+
+    Content is read from the file on demand instead of being held in memory
+    as a second copy. Blocking file I/O runs in a worker thread.
+    """
+
+    __slots__ = ("filename", "_file")
+
+    def __init__(self, file: BinaryIO, filename: str):
+        self.filename = filename
+        self._file = file
+
+    @property
+    def file(self) -> BinaryIO:
+        """Underlying binary file object, as on UploadFile."""
+        return self._file
+
+    async def read(self, size: int = -1) -> bytes:
+        return await asyncio.to_thread(self._file.read, size)
+
+    async def seek(self, position: int) -> None:
+        await asyncio.to_thread(self._file.seek, position)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        while chunk := await self.read(TEMP_UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
 
 
 async def process_presentation_to_html(request, file_content, input_format, output_format, step_config):
@@ -40,48 +76,37 @@ async def process_presentation_to_html(request, file_content, input_format, outp
         # Step 1: Convert PPTX to JSON using unstructured-io
         from io import BytesIO
 
-        # Create a temporary file for the PPTX content using centralized manager
-        manager = get_temp_manager("conversion")
-        temp_file = manager.create_temp_file(
-            content=file_content,
-            extension='.pptx',
-            prefix="pptx_conversion"
-        )
-        temp_file_path = temp_file.path
-
-        # Create a new UploadFile-like object for the PPTX content
-        class TempUploadFile:
-            def __init__(self, content: bytes, filename: str):
-                self.filename = filename
-                self.content = content
-                self._position = 0
+        # Small presentations stay in memory; larger ones roll over to disk
+        spool = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE)
+        await asyncio.to_thread(spool.write, file_content)
+        spool.seek(0)
+        # The spooled copy is the one passed on; drop our reference to the bytes
+        del file_content
 
-            async def read(self):
-                return self.content
-
-            async def seek(self, position: int):
-                self._position = position
-
-        temp_upload = TempUploadFile(file_content, "converted.pptx")
+        temp_upload = TempFileUpload(spool, "converted.pptx")
 
         # Convert PPTX to JSON
-        json_response = await _convert_file(
-            request=request,
-            file=temp_upload,
-            input_format="pptx",
-            output_format="json",
-            service=ConversionService.UNSTRUCTURED_IO
-        )
-
-        # Extract JSON content
-        json_content = b""
+        try:
+            json_response = await _convert_file(
+                request=request,
+                file=temp_upload,
+                input_format="pptx",
+                output_format="json",
+                service=ConversionService.UNSTRUCTURED_IO
+            )
+        finally:
+            temp_upload.close()
+
+        # Extract JSON content; extend one buffer instead of re-copying bytes per chunk
+        json_content = bytearray()
         async for chunk in json_response.body_iterator:
-            json_content += chunk
+            json_content.extend(chunk)
 
-        json_data = json.loads(json_content.decode('utf-8'))
+        json_data = loads_json(json_content)
 
         # Step 2: Convert JSON to HTML locally
-        html_content = process_unstructured_json_to_content(json_data, "html")
+        # Element rebuilding and rendering is CPU-bound; keep it off the event loop
+        html_content = await asyncio.to_thread(process_unstructured_json_to_content, json_data, "html")
 
         # Return HTML response
         return Response(
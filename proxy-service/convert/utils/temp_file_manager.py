@@ -10,14 +10,19 @@ This module provides a unified temporary file management system with:
 - Service-specific directory management
 """
 
+import errno
 import os
 import tempfile
 import asyncio
 import logging
 import hashlib
 import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List, Union, Dict, Any, AsyncContextManager, ContextManager
+from typing import Optional, List, Tuple, Union, Dict, Any, AsyncContextManager, ContextManager
 from contextlib import asynccontextmanager, contextmanager
 import weakref
 
@@ -29,6 +34,16 @@ logger = get_logger()
 # Default temporary directory
 DEFAULT_TEMP_DIR = "/tmp/applite-xtrac"
 
+# Maximum number of worker threads used to remove files concurrently
+CLEANUP_CONCURRENCY = 8
+
+# Content at least this large is stored once and hardlinked into temp paths
+DEDUP_MIN_SIZE = 64 * 1024
+# Number of distinct blobs each manager keeps available for reuse
+DEDUP_MAX_BLOBS = 1024
+# Total size of the blobs each manager keeps available for reuse
+DEDUP_MAX_BYTES = 256 * 1024 * 1024
+
 # Service-specific subdirectories
 SERVICE_DIRS = {
     "proxy": "proxy",
@@ -41,12 +56,355 @@ SERVICE_DIRS = {
     "pandoc": "pandoc",
 }
 
+# Service directories already created in this process, so new managers skip mkdir
+_created_service_dirs: set = set()
+
 
 class TempFileError(Exception):
     """Custom exception for temporary file operations."""
     pass
 
 
+def _remove_files(file_paths: List[str]) -> None:
+    """
+    Remove several files in one go (blocking I/O).
+
+    Missing files are ignored; other failures are logged, not raised.
+
+    Args:
+        file_paths: Paths of the files to remove
+    """
+    for path in file_paths:
+        try:
+            os.remove(path)
+            logger.debug(f"Cleaned up temporary file: {path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to cleanup temp file {path}: {e}")
+
+
+def _prune_shard_dirs(file_paths: List[str], shard_dirs: set) -> None:
+    """
+    Remove shard directories left empty by deleting file_paths.
+
+    Tries the file's shard and then its parent; a directory that still has
+    entries (ENOTEMPTY) or is already gone is simply left alone. A writer
+    racing with the removal recreates the shard via TempFileManager._in_shard.
+
+    Args:
+        file_paths: Paths of files just removed
+        shard_dirs: The manager's set of created shard directories
+    """
+    for shard_dir in {Path(path).parent for path in file_paths}:
+        if shard_dir not in shard_dirs:
+            continue
+        try:
+            shard_dir.rmdir()
+        except OSError:
+            continue
+        shard_dirs.discard(shard_dir)
+        logger.debug(f"Removed empty temp shard directory: {shard_dir}")
+        try:
+            shard_dir.parent.rmdir()
+        except OSError:
+            pass
+
+
+def _unlink_if_exists(path: Union[str, Path]) -> None:
+    """
+    Remove path so the next write creates a fresh inode.
+
+    Large temp files are hardlinks to a shared blob; opening one with
+    truncation would rewrite the blob and every other file linked to it.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _finalize_manager(
+    temp_files: Dict[str, "TempFileInfo"],
+    content_store: "_ContentStore",
+    shard_dirs: set,
+) -> None:
+    """
+    Finalizer for a collected (or, at exit, still live) TempFileManager.
+
+    Module-level and given only the manager's parts, never the manager,
+    so the finalizer does not keep the manager alive.
+
+    Args:
+        temp_files: Tracked files keyed by path
+        content_store: The manager's blob store
+        shard_dirs: The manager's created shard directories
+    """
+    paths = [f.path for f in temp_files.values() if f.auto_cleanup]
+    _remove_files(paths)
+    content_store.clear()
+    _prune_shard_dirs(paths, shard_dirs)
+
+
+async def _remove_files_async(file_paths: List[str]) -> None:
+    """
+    Remove several files from worker threads without blocking the event loop.
+
+    The paths are split across up to CLEANUP_CONCURRENCY threads, so on slow
+    (e.g. network) filesystems the wall time tracks the slowest batch rather
+    than the sum of every unlink.
+    """
+    if not file_paths:
+        return
+    workers = min(CLEANUP_CONCURRENCY, len(file_paths))
+    await asyncio.gather(*(
+        asyncio.to_thread(_remove_files, file_paths[i::workers])
+        for i in range(workers)
+    ))
+
+
+def _write_new_file(path: Path, content: bytes) -> None:
+    """Write content to path as a fresh inode, never through an existing link."""
+    _unlink_if_exists(path)
+    with open(path, 'wb') as f:
+        f.write(content)
+
+
+# os.link errors meaning the filesystem cannot hardlink at all (e.g. some
+# mounted, FUSE, SMB or overlay volumes)
+_LINK_UNSUPPORTED = {errno.EPERM, errno.EOPNOTSUPP, errno.EXDEV, errno.ENOSYS}
+
+
+# copy_file_range errors that mean "not supported here", not a real I/O failure
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+
+
+def _copy_file(source_path: Path, target_path: Path) -> None:
+    """
+    Copy a file's data and metadata like shutil.copy2, but inside the kernel where possible.
+
+    os.copy_file_range lets the filesystem copy (or reflink) the data without
+    it passing through user space. Platforms or filesystems without it fall
+    back to shutil.copyfile, which itself uses sendfile on Linux.
+
+    Args:
+        source_path: File to copy
+        target_path: Destination path (replaced by a new file if it exists)
+    """
+    if os.path.exists(target_path) and os.path.samefile(source_path, target_path):
+        raise shutil.SameFileError(f"{source_path} and {target_path} are the same file")
+    # Never truncate the existing target in place; it may share an inode with other files
+    _unlink_if_exists(target_path)
+
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        src_fd = os.open(source_path, os.O_RDONLY)
+        try:
+            dst_fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                remaining = os.fstat(src_fd).st_size
+                while remaining > 0:
+                    written = os.copy_file_range(src_fd, dst_fd, remaining)
+                    if written == 0:
+                        break
+                    remaining -= written
+                copied = True
+            except OSError as e:
+                if e.errno not in _COPY_RANGE_UNSUPPORTED:
+                    raise
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+    if not copied:
+        shutil.copyfile(source_path, target_path)
+    shutil.copystat(source_path, target_path)
+
+
+class _ContentStore:
+    """
+    Content-addressed blob store that serves repeated content via hardlinks.
+
+    Each distinct payload is written once under blob_dir, named by its hash,
+    and new temp files are hardlinked to it. A blob is deleted as soon as
+    its last temp file is released (link count back to 1), and otherwise
+    evicted least-recently-used beyond max_blobs or max_bytes; links already
+    handed out stay valid because they share the inode.
+    """
+
+    def __init__(
+        self,
+        blob_dir: Path,
+        max_blobs: int = DEDUP_MAX_BLOBS,
+        max_bytes: int = DEDUP_MAX_BYTES
+    ):
+        self.blob_dir = blob_dir
+        self.max_blobs = max_blobs
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Cleared on the first os.link failure that means the filesystem cannot link
+        self.links_supported = True
+        # digest -> (blob path, size), least recently used first
+        self._blobs: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()
+        self._total_bytes = 0
+        # temp file path -> digest of the blob it links to
+        self._links: Dict[str, str] = {}
+        # Writes may run in worker threads (create_temp_file_async)
+        self._lock = threading.Lock()
+
+    def link_into(self, content: bytes, target_path: Path) -> None:
+        """
+        Materialize content at target_path, reusing a stored blob when possible.
+
+        Args:
+            content: File content
+            target_path: Path to create (replaced if it already exists)
+        """
+        if not self.links_supported:
+            _write_new_file(target_path, content)
+            return
+
+        digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+
+        with self._lock:
+            entry = self._blobs.get(digest)
+            if entry is not None:
+                self._blobs.move_to_end(digest)
+
+        if entry is not None:
+            try:
+                self._link(entry[0], target_path)
+                with self._lock:
+                    self.hits += 1
+                self._track(str(target_path), digest)
+                return
+            except FileNotFoundError:
+                # Blob removed behind our back; store it again below
+                with self._lock:
+                    self._forget(digest)
+            except OSError as e:
+                self._link_failed(e, target_path, content)
+                return
+
+        blob_path = self.blob_dir / digest
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        # Write under a private name and rename, so no one links a partial blob
+        partial_path = self.blob_dir / f".{digest}.{threading.get_ident()}"
+        with open(partial_path, 'wb') as f:
+            f.write(content)
+        os.replace(partial_path, blob_path)
+        try:
+            self._link(blob_path, target_path)
+        except OSError as e:
+            # Not indexed yet, so nothing else would ever delete it
+            _remove_files([blob_path])
+            if isinstance(e, FileNotFoundError):
+                raise
+            self._link_failed(e, target_path, content)
+            return
+
+        with self._lock:
+            self.misses += 1
+            self._forget(digest)
+            self._blobs[digest] = (blob_path, len(content))
+            self._total_bytes += len(content)
+            over_budget = len(self._blobs) > self.max_blobs or self._total_bytes > self.max_bytes
+        if over_budget:
+            # Blobs whose temp files were deleted outside the manager go first
+            self._sweep_orphans()
+        with self._lock:
+            evicted = []
+            while self._blobs and (
+                len(self._blobs) > self.max_blobs or self._total_bytes > self.max_bytes
+            ):
+                evicted.append(self._forget(next(iter(self._blobs))))
+        _remove_files(evicted)
+        self._track(str(target_path), digest)
+
+    def _link_failed(self, error: OSError, target_path: Path, content: bytes) -> None:
+        """Fall back to a plain write when hardlinking into target_path fails."""
+        if error.errno in _LINK_UNSUPPORTED:
+            logger.info(f"Hardlinks unsupported in {self.blob_dir.parent}, disabling dedup: {error}")
+            self.links_supported = False
+            self.clear()
+        else:
+            logger.warning(f"Failed to link temp file {target_path}, writing it directly: {error}")
+        _write_new_file(target_path, content)
+        self.release([str(target_path)])
+
+    @staticmethod
+    def _link(blob_path: Path, target_path: Path) -> None:
+        try:
+            os.link(blob_path, target_path)
+        except FileExistsError:
+            os.remove(target_path)
+            os.link(blob_path, target_path)
+
+    def _forget(self, digest: str) -> Optional[Path]:
+        """Drop a blob from the index (lock held) and return its path."""
+        entry = self._blobs.pop(digest, None)
+        if entry is None:
+            return None
+        self._total_bytes -= entry[1]
+        return entry[0]
+
+    def _track(self, path: str, digest: str) -> None:
+        """Record that path links to digest, releasing whatever it linked to before."""
+        with self._lock:
+            previous = self._links.get(path)
+            self._links[path] = digest
+        if previous is not None and previous != digest:
+            self._drop_if_orphaned(previous)
+
+    def _drop_if_orphaned(self, digest: str) -> None:
+        """Delete a blob once no temp file links to it any more."""
+        with self._lock:
+            entry = self._blobs.get(digest)
+        if entry is None:
+            return
+        try:
+            orphaned = os.stat(entry[0]).st_nlink <= 1
+        except FileNotFoundError:
+            orphaned = True
+        if not orphaned:
+            return
+        with self._lock:
+            if self._blobs.get(digest) is not entry:
+                return
+            self._forget(digest)
+        _remove_files([entry[0]])
+
+    def _sweep_orphans(self) -> None:
+        """Delete every blob that no temp file links to any more."""
+        with self._lock:
+            digests = list(self._blobs)
+        for digest in digests:
+            self._drop_if_orphaned(digest)
+
+    def release(self, paths: List[str]) -> None:
+        """
+        Note that temp files were removed or replaced, deleting orphaned blobs.
+
+        Args:
+            paths: Temp file paths that no longer hold their linked content
+        """
+        with self._lock:
+            digests = {self._links.pop(path) for path in paths if path in self._links}
+        for digest in digests:
+            self._drop_if_orphaned(digest)
+
+    def clear(self) -> None:
+        """Forget all blobs and delete their files."""
+        with self._lock:
+            evicted = [entry[0] for entry in self._blobs.values()]
+            self._blobs.clear()
+            self._links.clear()
+            self._total_bytes = 0
+        _remove_files(evicted)
+
+
 class TempFileInfo:
     """Information about a temporary file."""
 
@@ -87,23 +445,32 @@ class TempFileManager:
         self.base_dir = Path(base_dir)
         self.service = service
         self.service_dir = self.base_dir / SERVICE_DIRS.get(service, service)
-        self.temp_files: List[TempFileInfo] = []
-        self._finalizer = weakref.finalize(self, self._cleanup_all_sync)
+        # Tracked files keyed by path, so single-file cleanup is O(1)
+        self.temp_files: Dict[str, TempFileInfo] = {}
+        self._content_store = _ContentStore(self.service_dir / ".blobs")
+        # Shard subdirectories already created, to skip the mkdir syscall
+        self._shard_dirs: set = set()
+        # Pass the parts, not a bound method: the finalizer must not reference self
+        self._finalizer = weakref.finalize(
+            self, _finalize_manager, self.temp_files, self._content_store, self._shard_dirs
+        )
 
         # Ensure directories exist
-        self.service_dir.mkdir(parents=True, exist_ok=True)
+        if self.service_dir not in _created_service_dirs:
+            self.service_dir.mkdir(parents=True, exist_ok=True)
+            _created_service_dirs.add(self.service_dir)
 
     def _cleanup_all_sync(self):
         """Synchronous cleanup of all managed files."""
-        for temp_file in self.temp_files:
-            if temp_file.auto_cleanup:
-                self._cleanup_file_sync(temp_file.path)
+        paths = [f.path for f in self.temp_files.values() if f.auto_cleanup]
+        _remove_files(paths)
+        _prune_shard_dirs(paths, self._shard_dirs)
 
     async def _cleanup_all_async(self):
         """Asynchronous cleanup of all managed files."""
-        for temp_file in self.temp_files:
-            if temp_file.auto_cleanup:
-                await self._cleanup_file_async(temp_file.path)
+        paths = [f.path for f in self.temp_files.values() if f.auto_cleanup]
+        await _remove_files_async(paths)
+        await asyncio.to_thread(_prune_shard_dirs, paths, self._shard_dirs)
 
     def _cleanup_file_sync(self, file_path: str):
         """Synchronously clean up a single file."""
@@ -116,12 +483,7 @@ class TempFileManager:
 
     async def _cleanup_file_async(self, file_path: str):
         """Asynchronously clean up a single file."""
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-                logger.debug(f"Cleaned up temporary file: {file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
+        await _remove_files_async([file_path])
 
     def generate_filename(
         self,
@@ -144,10 +506,10 @@ class TempFileManager:
         """
         if original_filename:
             # Use original filename with timestamp for uniqueness
-            import time
             timestamp = str(int(time.time()))
-            base_name = Path(original_filename).stem
-            ext = extension or Path(original_filename).suffix or ""
+            # Plain string split; no Path objects needed for a stem/suffix
+            base_name, suffix = os.path.splitext(os.path.basename(original_filename))
+            ext = extension or suffix
 
             if not ext.startswith(".") and ext:
                 ext = f".{ext}"
@@ -163,7 +525,6 @@ class TempFileManager:
 
         else:
             # Generate random filename
-            import uuid
             ext = extension or ""
             if not ext.startswith(".") and ext:
                 ext = f".{ext}"
@@ -190,40 +551,113 @@ class TempFileManager:
         Returns:
             TempFileInfo object
         """
-        if filename:
-            temp_path = self.service_dir / filename
-        else:
-            generated_name = self.generate_filename(
-                original_filename=None,
-                extension=extension,
-                prefix=prefix
-            )
-            temp_path = self.service_dir / generated_name
+        temp_path = self._resolve_temp_path(filename, extension, prefix)
 
         try:
-            if content is not None:
-                with open(temp_path, 'wb') as f:
-                    f.write(content)
-                logger.debug(f"Created temp file with content: {temp_path}")
-            else:
-                # Create empty file
-                temp_path.touch()
-                logger.debug(f"Created empty temp file: {temp_path}")
+            self._write_temp_file(temp_path, content)
+        except Exception as e:
+            logger.error(f"Failed to create temp file {temp_path}: {e}")
+            raise TempFileError(f"Failed to create temp file: {str(e)}")
 
-            temp_file = TempFileInfo(
-                path=str(temp_path),
-                service=self.service,
-                auto_cleanup=auto_cleanup
-            )
+        return self._register_temp_file(temp_path, auto_cleanup)
 
-            if auto_cleanup:
-                self.temp_files.append(temp_file)
+    def _resolve_temp_path(
+        self,
+        filename: Optional[str],
+        extension: Optional[str],
+        prefix: str
+    ) -> Path:
+        """Pick the path for a new temp file in this service's directory."""
+        if filename:
+            return self._shard_path(filename)
+        generated_name = self.generate_filename(
+            original_filename=None,
+            extension=extension,
+            prefix=prefix
+        )
+        return self._shard_path(generated_name)
 
-            return temp_file
+    def _shard_path(self, name: str) -> Path:
+        """
+        Place a file name under two levels of hash-named subdirectories.
 
-        except Exception as e:
-            logger.error(f"Failed to create temp file {temp_path}: {e}")
-            raise TempFileError(f"Failed to create temp file: {str(e)}")
+        Spreading files over service_dir/ab/cd/ keeps every directory small,
+        so lookups and unlinks stay fast however many files accumulate.
+
+        Args:
+            name: File name
+
+        Returns:
+            Path of the file inside its (created) shard directory
+        """
+        digest = hashlib.blake2s(name.encode(), digest_size=2).hexdigest()
+        shard_dir = self.service_dir / digest[:2] / digest[2:]
+        if shard_dir not in self._shard_dirs:
+            shard_dir.mkdir(parents=True, exist_ok=True)
+            self._shard_dirs.add(shard_dir)
+        return shard_dir / name
+
+    def _in_shard(self, temp_path: Path, func, *args):
+        """
+        Run a blocking write into temp_path's shard, recreating the shard once if needed.
+
+        Shard directories are cached as created, but an external tmp cleaner
+        may remove them from under a long-lived manager.
+
+        Args:
+            temp_path: File being written
+            func: Callable performing the write
+            *args: Arguments for func
+
+        Returns:
+            Whatever func returns
+        """
+        try:
+            return func(*args)
+        except FileNotFoundError:
+            shard_dir = temp_path.parent
+            if shard_dir.is_dir():
+                # Something else is missing (e.g. the copy source); not ours to fix
+                raise
+            logger.debug(f"Recreating removed temp shard directory: {shard_dir}")
+            self._shard_dirs.discard(shard_dir)
+            _created_service_dirs.discard(self.service_dir)
+            shard_dir.mkdir(parents=True, exist_ok=True)
+            self._shard_dirs.add(shard_dir)
+            return func(*args)
+
+    def _write_temp_file(self, temp_path: Path, content: Optional[bytes]) -> None:
+        """Write content to temp_path, or create it empty (blocking I/O)."""
+        self._in_shard(temp_path, self._write_content, temp_path, content)
+
+    def _write_content(self, temp_path: Path, content: Optional[bytes]) -> None:
+        """Write content to temp_path in an existing directory."""
+        if content is not None and len(content) >= DEDUP_MIN_SIZE:
+            # Identical payloads (retries, one document to several formats) share one blob
+            self._content_store.link_into(content, temp_path)
+            logger.debug(f"Created temp file with content: {temp_path}")
+        elif content is not None:
+            # The path may currently be a link to a shared blob; write a new file instead
+            _write_new_file(temp_path, content)
+            self._content_store.release([str(temp_path)])
+            logger.debug(f"Created temp file with content: {temp_path}")
+        else:
+            # Create empty file
+            temp_path.touch()
+            logger.debug(f"Created empty temp file: {temp_path}")
+
+    def _register_temp_file(self, temp_path: Path, auto_cleanup: bool) -> TempFileInfo:
+        """Wrap a created file in TempFileInfo and track it for cleanup."""
+        temp_file = TempFileInfo(
+            path=str(temp_path),
+            service=self.service,
+            auto_cleanup=auto_cleanup
+        )
+
+        if auto_cleanup:
+            self.temp_files[temp_file.path] = temp_file
+
+        return temp_file
 
     async def create_temp_file_async(
         self,
@@ -246,9 +680,17 @@ class TempFileManager:
         Returns:
             TempFileInfo object
         """
-        # For now, delegate to sync version since file operations are fast
-        # In the future, could use aiofiles for true async file operations
-        return self.create_temp_file(content, filename, extension, prefix, auto_cleanup)
+        temp_path = self._resolve_temp_path(filename, extension, prefix)
+
+        try:
+            # The write runs in a worker thread so slow disks do not block the event loop
+            await asyncio.to_thread(self._write_temp_file, temp_path, content)
+        except Exception as e:
+            logger.error(f"Failed to create temp file {temp_path}: {e}")
+            raise TempFileError(f"Failed to create temp file: {str(e)}")
+
+        # Bookkeeping stays on the event loop thread
+        return self._register_temp_file(temp_path, auto_cleanup)
 
     def copy_to_temp(
         self,
@@ -272,13 +714,11 @@ class TempFileManager:
         if not source_path.exists():
             raise TempFileError(f"Source file does not exist: {source_path}")
 
-        if filename:
-            temp_path = self.service_dir / filename
-        else:
-            temp_path = self.service_dir / source_path.name
+        temp_path = self._shard_path(filename or source_path.name)
 
         try:
-            shutil.copy2(source_path, temp_path)
+            self._in_shard(temp_path, _copy_file, source_path, temp_path)
+            self._content_store.release([str(temp_path)])
             logger.debug(f"Copied file to temp: {source_path} -> {temp_path}")
 
             temp_file = TempFileInfo(
@@ -288,7 +728,7 @@ class TempFileManager:
             )
 
             if auto_cleanup:
-                self.temp_files.append(temp_file)
+                self.temp_files[temp_file.path] = temp_file
 
             return temp_file
 
@@ -317,45 +757,69 @@ class TempFileManager:
         )
 
         if auto_cleanup:
-            self.temp_files.append(temp_file)
+            self.temp_files[temp_file.path] = temp_file
 
         logger.debug(f"Added existing file to manager: {file_path}")
         return temp_file
 
+    def _release_file(self, file_path: str) -> None:
+        """Drop the blob and empty shard directories a removed file leaves behind."""
+        self._content_store.release([file_path])
+        _prune_shard_dirs([file_path], self._shard_dirs)
+
     def cleanup_file(self, file_path: str):
         """Manually cleanup a specific file."""
         self._cleanup_file_sync(file_path)
+        self._release_file(file_path)
 
         # Remove from managed files list
-        self.temp_files = [f for f in self.temp_files if f.path != file_path]
+        self.temp_files.pop(file_path, None)
 
     async def cleanup_file_async(self, file_path: str):
         """Asynchronously cleanup a specific file."""
         await self._cleanup_file_async(file_path)
+        await asyncio.to_thread(self._release_file, file_path)
 
         # Remove from managed files list
-        self.temp_files = [f for f in self.temp_files if f.path != file_path]
+        self.temp_files.pop(file_path, None)
 
     def cleanup_all(self):
         """Manually cleanup all managed files."""
         self._cleanup_all_sync()
         self.temp_files.clear()
+        self._content_store.clear()
 
     async def cleanup_all_async(self):
         """Asynchronously cleanup all managed files."""
         await self._cleanup_all_async()
         self.temp_files.clear()
+        await asyncio.to_thread(self._content_store.clear)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about managed files."""
         total_size = 0
         file_count = len(self.temp_files)
+        pending = set(self.temp_files)
 
-        for temp_file in self.temp_files:
+        # Sizes come from directory scans of this manager's shards, whose
+        # entries carry cached stat data, rather than a stat per file
+        for shard_dir in list(self._shard_dirs):
+            if not pending:
+                break
             try:
-                if os.path.exists(temp_file.path):
-                    total_size += os.path.getsize(temp_file.path)
-            except Exception:
+                with os.scandir(shard_dir) as entries:
+                    for entry in entries:
+                        if entry.path in pending:
+                            pending.discard(entry.path)
+                            total_size += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                pass
+
+        # Files added from elsewhere (add_existing_file) need a stat each
+        for path in pending:
+            try:
+                total_size += os.stat(path).st_size
+            except OSError:
                 pass
 
         return {
@@ -363,7 +827,9 @@ class TempFileManager:
             "file_count": file_count,
             "total_size_bytes": total_size,
             "service_dir": str(self.service_dir),
-            "files": [f.path for f in self.temp_files]
+            "files": list(self.temp_files),
+            "dedup_hits": self._content_store.hits,
+            "dedup_misses": self._content_store.misses
         }
 
     # Context manager support
@@ -382,23 +848,36 @@ class TempFileManager:
 
 
 # Global manager instances
-_managers: Dict[str, TempFileManager] = {}
+# Live managers; an entry disappears once nothing else references its manager
+_managers: "weakref.WeakValueDictionary[Tuple[str, str], TempFileManager]" = weakref.WeakValueDictionary()
+# Managers requested with pin=True, kept alive for the lifetime of the process
+_pinned_managers: Dict[Tuple[str, str], TempFileManager] = {}
 
-def get_temp_manager(service: str = "default", base_dir: str = DEFAULT_TEMP_DIR) -> TempFileManager:
+def get_temp_manager(
+    service: str = "default",
+    base_dir: str = DEFAULT_TEMP_DIR,
+    pin: bool = True
+) -> TempFileManager:
     """
     Get or create a temporary file manager for a service.
 
     Args:
         service: Service name
         base_dir: Base directory for temp files
+        pin: Keep the manager alive for the process lifetime (singleton
+            semantics). Unpinned managers are collected, and their files
+            cleaned up, once the caller drops them.
 
     Returns:
         TempFileManager instance
     """
-    key = f"{service}:{base_dir}"
-    if key not in _managers:
-        _managers[key] = TempFileManager(base_dir=base_dir, service=service)
-    return _managers[key]
+    key = (service, base_dir)
+    manager = _managers.get(key)
+    if manager is None:
+        manager = _managers[key] = TempFileManager(base_dir=base_dir, service=service)
+    if pin:
+        _pinned_managers[key] = manager
+    return manager
 
 
 # Convenience functions for common operations
@@ -486,26 +965,24 @@ async def async_temp_file_manager(service: str = "default", base_dir: str = DEFA
 
 
 # Cleanup utilities
+def _release_blobs(file_paths: List[str]) -> None:
+    """Let every live manager drop blobs and shard directories orphaned by removing file_paths."""
+    for manager in list(_managers.values()):
+        manager._content_store.release(file_paths)
+        _prune_shard_dirs(file_paths, manager._shard_dirs)
+
+
 def cleanup_temp_files(file_paths: List[str]):
     """Clean up multiple temporary files."""
-    for path in file_paths:
-        try:
-            if os.path.exists(path):
-                os.remove(path)
-                logger.debug(f"Cleaned up temporary file: {path}")
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temp file {path}: {e}")
+    _remove_files(file_paths)
+    _release_blobs(file_paths)
 
 
 async def cleanup_temp_files_async(file_paths: List[str]):
     """Asynchronously clean up multiple temporary files."""
-    for path in file_paths:
-        try:
-            if os.path.exists(path):
-                os.remove(path)
-                logger.debug(f"Cleaned up temporary file: {path}")
-        except Exception as e:
-            logger.warning(f"Failed to cleanup temp file {path}: {e}")
+    file_paths = list(file_paths)
+    await _remove_files_async(file_paths)
+    await asyncio.to_thread(_release_blobs, file_paths)
 
 
 # Legacy compatibility functions (for gradual migration)
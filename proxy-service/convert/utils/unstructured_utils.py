@@ -5,13 +5,15 @@ This module provides centralized functions for converting unstructured-io JSON r
 to various output formats, eliminating code duplication across the codebase.
 """
 
-from typing import List, Union, Optional
+from typing import BinaryIO, List, Union, Optional
 from fastapi import HTTPException
 import logging
 
 # Import httpx for async HTTP requests
 import httpx
 
+from .conversion_core import fix_table_text_as_html
+
 # Import unstructured libraries
 try:
     from unstructured.staging.base import elements_to_md, elements_to_text, dict_to_elements
@@ -22,9 +24,90 @@ except ImportError:
     dict_to_elements = None
     UNSTRUCTURED_AVAILABLE = False
 
+# Optional incremental JSON parser for streamed unstructured-io responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    ijson = None
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+class _AsyncByteReader:
+    """
+    Expose an async byte iterator through the async read() ijson expects.
+
+    Also records the first non-whitespace byte of the body, so callers can
+    tell which JSON type the document starts with.
+    """
+
+    __slots__ = ("_chunks", "first_byte")
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self.first_byte: Optional[bytes] = None
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson probes the reader's type with read(0); consume nothing
+            return b""
+        # ijson accepts chunks of any length and stops on b""
+        chunk = await anext(self._chunks, b"")
+        if self.first_byte is None:
+            stripped = chunk.lstrip()
+            if stripped:
+                self.first_byte = stripped[:1]
+        return chunk
+
+
+async def _stream_unstructured_elements(
+    client: "httpx.AsyncClient",
+    url: str,
+    files: dict,
+    data: dict
+) -> List[dict]:
+    """
+    POST to unstructured-io and parse the element array while it downloads.
+
+    Elements are decoded one by one from the response stream, so the raw
+    JSON body is never buffered alongside the parsed result.
+
+    Args:
+        client: HTTP client for making requests
+        url: Partition endpoint URL
+        files: Multipart files for the request
+        data: Form fields for the request
+
+    Returns:
+        List of element dictionaries
+
+    Raises:
+        HTTPException: If the service responds with an error status
+    """
+    async with client.stream("POST", url, files=files, data=data) as response:
+        if response.status_code != 200:
+            await response.aread()
+            raise HTTPException(
+                status_code=response.status_code,
+                detail=f"Unstructured-IO service error: {response.text}"
+            )
+
+        reader = _AsyncByteReader(response.aiter_bytes())
+        # use_float keeps coordinates as floats rather than Decimal, matching response.json()
+        elements = [item async for item in ijson.items_async(reader, "item", use_float=True)]
+
+    # items_async silently yields nothing for any other top-level value,
+    # such as an error object sent with status 200
+    if reader.first_byte != b"[":
+        raise HTTPException(
+            status_code=502,
+            detail="Unstructured-IO service returned a response that is not a JSON array of elements"
+        )
+    return elements
+
+
 def process_unstructured_json_to_content(
     json_data: List[dict],
     output_format: str,
@@ -56,13 +139,10 @@ def process_unstructured_json_to_content(
     try:
         # Fix table text_as_html issues if requested
         if fix_tables:
-            from .conversion_core import fix_table_text_as_html
             json_data = fix_table_text_as_html(json_data)
 
-        # Convert JSON to elements
-        elements = []
-        for item in json_data:
-            elements.extend(dict_to_elements([item]))
+        # Convert JSON to elements in a single library call
+        elements = dict_to_elements(json_data)
 
         # Filter out elements with None text to prevent join errors
         filtered_elements = [elem for elem in elements if elem.text is not None]
@@ -83,18 +163,19 @@ def process_unstructured_json_to_content(
                 )
             content = elements_to_text(filtered_elements)
         elif output_format == "html":
-            # For HTML, extract text_as_html from table elements and combine with regular text
-            content_parts = []
+            # For HTML, extract text_as_html from table elements and combine with regular text.
+            # The document shell is part of the same list so the body is copied only once.
+            content_parts = ["<!DOCTYPE html>\n<html>\n<head>\n<title>Converted Document</title>\n</head>\n<body>"]
             for elem in filtered_elements:
-                if hasattr(elem, 'text_as_html') and elem.text_as_html:
-                    content_parts.append(elem.text_as_html)
+                text_as_html = getattr(elem, 'text_as_html', None)
+                if text_as_html:
+                    content_parts.append(text_as_html)
                 elif elem.text:
                     # Wrap regular text in paragraph tags
                     content_parts.append(f"<p>{elem.text}</p>")
-            
+            content_parts.append("</body>\n</html>")
+
             content = "\n".join(content_parts)
-            # Wrap in basic HTML structure
-            content = f"<!DOCTYPE html>\n<html>\n<head>\n<title>Converted Document</title>\n</head>\n<body>\n{content}\n</body>\n</html>"
         else:
             raise HTTPException(
                 status_code=400,
@@ -131,13 +212,10 @@ def json_to_elements(json_data: List[dict], fix_tables: bool = True) -> List:
     try:
         # Fix table text_as_html issues if requested
         if fix_tables:
-            from .conversion_core import fix_table_text_as_html
             json_data = fix_table_text_as_html(json_data)
 
-        # Convert JSON to elements
-        elements = []
-        for item in json_data:
-            elements.extend(dict_to_elements([item]))
+        # Convert JSON to elements in a single library call
+        elements = dict_to_elements(json_data)
 
         return elements
 
@@ -152,7 +230,7 @@ def json_to_elements(json_data: List[dict], fix_tables: bool = True) -> List:
 async def convert_file_with_unstructured_io(
     client: "httpx.AsyncClient",
     service_url: str,
-    file_content: bytes,
+    file_content: Union[bytes, BinaryIO],
     filename: str,
     content_type: str,
     output_format: str,
@@ -169,7 +247,8 @@ async def convert_file_with_unstructured_io(
     Args:
         client: HTTP client for making requests
         service_url: URL of the unstructured-io service
-        file_content: Raw file content bytes
+        file_content: Raw file content bytes, or a binary file object (such as
+            an UploadFile's spooled file) that httpx streams in chunks
         filename: Original filename
         content_type: MIME type of the file
         output_format: Desired output format ("md", "txt", "html")
@@ -182,24 +261,26 @@ async def convert_file_with_unstructured_io(
         HTTPException: If conversion fails
     """
     try:
-        # Prepare request to unstructured-io service
+        # Prepare request to unstructured-io service; file objects are read
+        # by the multipart encoder chunk by chunk rather than held in memory
         files = {"files": (filename, file_content, content_type)}
         data = {}
+        url = f"{service_url}/general/v0/general"
 
-        response = await client.post(
-            f"{service_url}/general/v0/general",
-            files=files,
-            data=data
-        )
+        if IJSON_AVAILABLE:
+            # Parse elements incrementally as the response arrives
+            json_data = await _stream_unstructured_elements(client, url, files, data)
+        else:
+            response = await client.post(url, files=files, data=data)
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Unstructured-IO service error: {response.text}"
-            )
+            if response.status_code != 200:
+                raise HTTPException(
+                    status_code=response.status_code,
+                    detail=f"Unstructured-IO service error: {response.text}"
+                )
 
-        # Parse JSON response
-        json_data = response.json()
+            # Parse JSON response
+            json_data = response.json()
 
         # Convert to requested format
         return process_unstructured_json_to_content(json_data, output_format, fix_tables)
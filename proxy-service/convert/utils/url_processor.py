@@ -136,6 +136,13 @@ class URLFileWrapper:
             self._file = open(self.file_path, 'rb')
         self._file.seek(position)
 
+    @property
+    def file(self):
+        """Underlying binary file object, opened on first use (like UploadFile.file)."""
+        if self._file is None:
+            self._file = open(self.file_path, 'rb')
+        return self._file
+
     async def close(self):
         """Close the file handle."""
         if self._file:
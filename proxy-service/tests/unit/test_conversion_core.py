@@ -0,0 +1,188 @@
+"""
+Unit tests for conversion_core helper functions.
+"""
+
+import asyncio
+import json
+import zipfile
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from convert.utils import conversion_core
+from convert.utils.conversion_core import (
+    _coerce_form_value,
+    _reconstruct_table_html,
+    _upload_body,
+    build_batch_archive,
+    convert_batch,
+)
+
+
+class TestCoerceFormValue:
+    """Test cases for form parameter type coercion."""
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("true", True),
+        ("FALSE", False),
+        ("42", 42),
+        ("-7", -7),
+        ("1.5", 1.5),
+        ("-0.25", -0.25),
+        ("1e3", 1000.0),
+    ])
+    def test_coerces_booleans_and_numbers(self, raw: str, expected):
+        """Test that boolean and numeric strings are converted."""
+        result = _coerce_form_value(raw)
+        assert result == expected
+        assert type(result) is type(expected)
+
+    @pytest.mark.parametrize("raw", ["auto", "hi_res", "1.2.3", "", "nan", "inf"])
+    def test_leaves_other_strings_untouched(self, raw: str):
+        """Test that non-numeric strings are returned unchanged."""
+        assert _coerce_form_value(raw) == raw
+
+
+class TestReconstructTableHtml:
+    """Test cases for rebuilding table markup from plain text."""
+
+    def test_tab_separated_table(self):
+        """Test that tab-separated rows become table rows with escaped cells."""
+        html = _reconstruct_table_html("Name\tNotes\nBob\t<b> & co")
+        assert html == (
+            "<table><tbody>"
+            "<tr><td>Name</td><td>Notes</td></tr>"
+            "<tr><td>Bob</td><td>&lt;b&gt; &amp; co</td></tr>"
+            "</tbody></table>"
+        )
+
+    def test_single_row_returns_empty(self):
+        """Test that a table needs at least two rows to be reconstructed."""
+        assert _reconstruct_table_html("just one line") == ""
+
+
+class _FakeUpload:
+    """Minimal stand-in for an UploadFile."""
+
+    def __init__(self, filename: str, content: bytes = b""):
+        self.filename = filename
+        self._buffer = BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._buffer.read(size)
+
+    async def seek(self, position: int) -> None:
+        self._buffer.seek(position)
+
+
+class TestUploadBody:
+    """Test cases for handing uploads to httpx."""
+
+    async def test_returns_rewound_file_object_without_copying(self):
+        """Test that an upload's own file object is rewound and passed through."""
+        upload = _FakeUpload("doc.docx", b"0123456789")
+        upload.file = upload._buffer
+        await upload.read(3)
+
+        body = await _upload_body(upload)
+
+        assert body is upload._buffer
+        assert body.read() == b"0123456789"
+
+    async def test_reads_uploads_without_a_file_object(self):
+        """Test that wrappers lacking a file attribute fall back to their full content."""
+        upload = _FakeUpload("doc.docx", b"0123456789")
+        await upload.read(3)
+
+        assert await _upload_body(upload) == b"0123456789"
+
+
+class TestConvertBatch:
+    """Test cases for concurrent batch conversion."""
+
+    async def test_collects_results_and_errors_in_order(self, monkeypatch):
+        """Test that each file gets a result and failures do not abort the batch."""
+        async def fake_convert_file(request, file=None, **kwargs):
+            if file.filename == "bad.docx":
+                raise HTTPException(status_code=500, detail="Conversion failed: boom")
+            return StreamingResponse(
+                BytesIO(file.filename.encode()),
+                media_type="application/pdf",
+                headers={"Content-Disposition": f"attachment; filename={file.filename}.pdf"}
+            )
+
+        monkeypatch.setattr(conversion_core, "_convert_file", fake_convert_file)
+        uploads = [_FakeUpload("a.docx"), _FakeUpload("bad.docx"), _FakeUpload("b.docx")]
+
+        results = await convert_batch(None, uploads, "docx", "pdf")
+
+        assert [r["filename"] for r in results] == ["a.docx", "bad.docx", "b.docx"]
+        assert results[0]["output_filename"] == "a.docx.pdf"
+        assert results[0]["content"] == b"a.docx"
+        assert results[1]["error"] == "Conversion failed: boom"
+        assert results[2]["content"] == b"b.docx"
+
+    async def test_rejects_too_many_files(self, monkeypatch):
+        """Test that batches above the file limit fail before anything is converted."""
+        monkeypatch.setattr(conversion_core, "BATCH_MAX_FILES", 2)
+        uploads = [_FakeUpload(f"{i}.docx") for i in range(3)]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await convert_batch(None, uploads, "docx", "pdf")
+
+        assert exc_info.value.status_code == 400
+
+    async def test_fails_files_beyond_output_budget(self, monkeypatch):
+        """Test that output beyond the byte budget is dropped and reported per file."""
+        async def fake_convert_file(request, file=None, **kwargs):
+            return StreamingResponse(BytesIO(b"x" * 10), media_type="application/pdf")
+
+        monkeypatch.setattr(conversion_core, "_convert_file", fake_convert_file)
+        monkeypatch.setattr(conversion_core, "BATCH_MAX_BYTES", 15)
+        # One at a time, so the order in which the budget runs out is fixed
+        monkeypatch.setattr(conversion_core, "_conversion_semaphore", asyncio.Semaphore(1))
+        uploads = [_FakeUpload("a.docx"), _FakeUpload("b.docx"), _FakeUpload("c.docx")]
+
+        results = await convert_batch(None, uploads, "docx", "pdf")
+
+        assert results[0]["content"] == b"x" * 10
+        assert "content" not in results[1] and "content" not in results[2]
+        assert "exceeds 15 bytes" in results[1]["error"]["details"]
+
+    async def test_structured_error_detail_reaches_manifest(self, monkeypatch):
+        """Test that a dict HTTPException detail is kept as JSON, not a Python repr."""
+        detail = {"error": "Conversion failed", "details": "bad table"}
+
+        async def fake_convert_file(request, file=None, **kwargs):
+            raise HTTPException(status_code=500, detail=detail)
+
+        monkeypatch.setattr(conversion_core, "_convert_file", fake_convert_file)
+
+        results = await convert_batch(None, [_FakeUpload("bad.docx")], "docx", "pdf")
+
+        assert results[0]["error"] == detail
+        with zipfile.ZipFile(build_batch_archive(results)) as zf:
+            manifest = json.loads(zf.read("manifest.json"))
+        assert manifest == [{"filename": "bad.docx", "error": detail}]
+
+
+class TestBuildBatchArchive:
+    """Test cases for packaging batch results."""
+
+    def test_writes_outputs_and_manifest(self):
+        """Test that outputs are stored under unique names next to a manifest of every result."""
+        results = [
+            {"filename": "a.docx", "output_filename": "out.pdf", "content": b"one"},
+            {"filename": "b.docx", "error": "boom"},
+            {"filename": "c.docx", "output_filename": "out.pdf", "content": b"two"},
+        ]
+
+        with zipfile.ZipFile(build_batch_archive(results)) as zf:
+            assert zf.read("out.pdf") == b"one"
+            assert zf.read("2_out.pdf") == b"two"
+            manifest = json.loads(zf.read("manifest.json"))
+
+        assert manifest[1] == {"filename": "b.docx", "error": "boom"}
+        assert manifest[2]["output_filename"] == "2_out.pdf"
@@ -0,0 +1,119 @@
+"""
+Unit tests for centralized error handling helpers.
+"""
+
+import json
+import re
+
+import pytest
+from fastapi import HTTPException
+
+from convert.utils.error_handling import (
+    AppXtracError,
+    ErrorCode,
+    _truncate,
+    _utcnow_iso,
+    app_error_handler,
+    create_error_response,
+    handle_service_error,
+    validate_format_parameter,
+)
+
+
+class TestUtcNowIso:
+    """Test cases for error timestamp formatting."""
+
+    def test_format_is_utc_with_milliseconds(self):
+        """Test that timestamps are ISO 8601 UTC with millisecond precision."""
+        assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z", _utcnow_iso())
+
+
+class TestHandleServiceError:
+    """Test cases for service error classification."""
+
+    @pytest.mark.parametrize("message, expected_status", [
+        ("Read Timeout while waiting", 504),
+        ("request TIMED OUT", 504),
+        ("Connection refused", 503),
+        ("host unreachable", 503),
+        ("bad gateway response", 502),
+    ])
+    def test_classifies_by_message(self, message: str, expected_status: int):
+        """Test that the error message selects the matching status code."""
+        response = handle_service_error("gotenberg", RuntimeError(message))
+        assert response.status_code == expected_status
+
+
+class TestValidateFormatParameter:
+    """Test cases for format parameter validation."""
+
+    @pytest.mark.parametrize("value", ["pdf", "docx", "md", "numbers"])
+    def test_accepts_valid_formats(self, value: str):
+        """Test that short alphanumeric formats pass validation."""
+        validate_format_parameter(value, "input_format", 2, 7)
+
+    @pytest.mark.parametrize("value, expected_error", [
+        ("x", "PARAMETER_OUT_OF_RANGE"),
+        ("markdown1", "PARAMETER_OUT_OF_RANGE"),
+        ("tar.gz", "INVALID_FORMAT"),
+        (42, "INVALID_PARAMETER"),
+    ])
+    def test_rejects_invalid_formats(self, value, expected_error: str):
+        """Test that invalid formats raise the specific error code."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_format_parameter(value, "input_format", 2, 7)
+        assert exc_info.value.detail["error"] == expected_error
+
+
+class TestTruncate:
+    """Test cases for error detail truncation."""
+
+    def test_short_string_is_returned_unchanged(self):
+        """Test that strings within the limit are returned as the same object."""
+        details = "short message"
+        assert _truncate(details, 500) is details
+
+    def test_long_and_non_string_values(self):
+        """Test that long values are cut and non-strings are stringified."""
+        assert _truncate("x" * 20, 5) == "xxxxx"
+        assert _truncate(ValueError("boom"), 500) == "boom"
+
+
+class TestAppErrorHandler:
+    """Test cases for rendering AppXtracError."""
+
+    async def test_renders_standard_payload(self):
+        """Test that the handler produces the create_error_response payload."""
+        exc = AppXtracError(ErrorCode.SERVICE_UNAVAILABLE, service="unstructured", details="down", attempt=2)
+        response = await app_error_handler(None, exc)
+        payload = json.loads(response.body)
+        assert response.status_code == 503
+        assert payload["error"] == "SERVICE_UNAVAILABLE"
+        assert payload["service"] == "unstructured"
+        assert payload["details"] == "down"
+        assert payload["attempt"] == 2
+
+
+class TestCreateErrorResponse:
+    """Test cases for building error responses."""
+
+    def test_bare_error_code_uses_static_body(self):
+        """Test that the pre-rendered body is valid JSON with a timestamp."""
+        response = create_error_response(ErrorCode.NOT_FOUND)
+        payload = json.loads(response.body)
+        assert response.status_code == 404
+        assert response.media_type == "application/json"
+        assert payload == {
+            "error": "NOT_FOUND",
+            "status_code": 404,
+            "severity": "low",
+            "timestamp": payload["timestamp"]
+        }
+
+    def test_details_and_status_override(self):
+        """Test that extra information falls back to the full payload."""
+        response = create_error_response(ErrorCode.NOT_FOUND, details="missing", status_code=410)
+        payload = json.loads(response.body)
+        assert response.status_code == 410
+        assert payload["status_code"] == 410
+        assert payload["details"] == "missing"
@@ -0,0 +1,114 @@
+"""
+Unit tests for the centralized HTTP client factory.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from convert.utils.http_client import HTTPClientFactory, RetryConfig, ServiceType, _parse_retry_after
+
+
+class TestHTTPClientFactory:
+    """Test cases for HTTP client creation and reuse."""
+
+    async def test_reuses_client_per_service_type(self):
+        """Test that repeated calls share one client per service type."""
+        factory = HTTPClientFactory()
+        try:
+            first = factory.create_client(ServiceType.GOTENBERG)
+            assert factory.create_client(ServiceType.GOTENBERG) is first
+            assert factory.get_or_create_client(ServiceType.GOTENBERG) is first
+            assert factory.create_client(ServiceType.LIBREOFFICE) is not first
+        finally:
+            await factory.close_all_clients()
+
+    async def test_overrides_create_separate_client(self):
+        """Test that overrides never replace the shared client and are cached per override set."""
+        factory = HTTPClientFactory()
+        try:
+            shared = factory.create_client(ServiceType.PANDOC)
+            custom = factory.create_client(ServiceType.PANDOC, follow_redirects=True)
+            assert custom is not shared
+            assert factory.create_client(ServiceType.PANDOC, follow_redirects=True) is custom
+            assert factory.get_client(ServiceType.PANDOC) is shared
+        finally:
+            await factory.close_all_clients()
+        assert custom.is_closed
+
+    async def test_identity_based_overrides_are_not_cached(self):
+        """Test that overrides without a value-based key get a fresh, uncached client."""
+        factory = HTTPClientFactory()
+        try:
+            timeout = factory.create_client(ServiceType.PANDOC, timeout=httpx.Timeout(5.0))
+            assert factory.create_client(ServiceType.PANDOC, timeout=httpx.Timeout(5.0)) is timeout
+
+            hooks = {"request": [lambda request: None]}
+            hooked = factory.create_client(ServiceType.PANDOC, event_hooks=hooks)
+            rehooked = factory.create_client(ServiceType.PANDOC, event_hooks=hooks)
+            assert rehooked is not hooked
+            assert len(factory._override_clients) == 1
+            await hooked.aclose()
+            await rehooked.aclose()
+        finally:
+            await factory.close_all_clients()
+
+    async def test_concurrent_identical_gets_are_coalesced(self, monkeypatch):
+        """Test that concurrent identical GETs share one upstream request."""
+        factory = HTTPClientFactory()
+        calls = []
+
+        async def fake_request(service_type, method, url, retry_config=None, **kwargs):
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return object()
+
+        monkeypatch.setattr(factory, "request_with_retry", fake_request)
+        results = await asyncio.gather(
+            factory.get_with_retry(ServiceType.DEFAULT, "http://svc/health", params={"a": "1"}),
+            factory.get_with_retry(ServiceType.DEFAULT, "http://svc/health", params={"a": "1"}),
+            factory.get_with_retry(ServiceType.DEFAULT, "http://svc/other"),
+        )
+
+        assert results[0] is results[1]
+        assert results[2] is not results[0]
+        assert sorted(calls) == ["http://svc/health", "http://svc/other"]
+        assert factory._inflight == {}
+
+
+class TestParseRetryAfter:
+    """Test cases for Retry-After header parsing."""
+
+    def test_delay_seconds(self):
+        """Test that integer delays are returned as seconds."""
+        assert _parse_retry_after("120") == 120.0
+        assert _parse_retry_after(" 3 ") == 3.0
+
+    def test_http_date_in_the_past(self):
+        """Test that past HTTP-dates clamp to zero."""
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", "-5"])
+    def test_invalid_values(self, value):
+        """Test that missing or malformed headers are ignored."""
+        assert _parse_retry_after(value) is None
+
+
+class TestRetryConfig:
+    """Test cases for retry configuration."""
+
+    def test_is_immutable(self):
+        """Test that settings cannot be changed or extended after creation."""
+        config = RetryConfig(max_attempts=5)
+        with pytest.raises(AttributeError):
+            config.max_attempts = 1
+        with pytest.raises(AttributeError):
+            config.extra = True
+        assert config.max_attempts == 5
+        assert 503 in config.retry_status_codes
+
+    def test_delay_schedule_is_capped(self):
+        """Test that the precomputed backoff grows exponentially up to max_delay."""
+        config = RetryConfig(max_attempts=5, base_delay=1.0, max_delay=5.0, backoff_factor=2.0)
+        assert config._delay_schedule == (1.0, 2.0, 4.0, 5.0, 5.0)
@@ -0,0 +1,72 @@
+"""
+Unit tests for the centralized logging configuration.
+"""
+
+import io
+import json
+import logging
+import logging.handlers
+import queue
+
+from convert.utils.logging_config import JSONFormatter, LogConfig, _ExceptionPreservingQueueHandler
+
+
+class TestJSONFormatter:
+    """Test cases for JSON log formatting."""
+
+    def test_escapes_quotes_and_newlines(self):
+        """Test that messages with special characters still produce valid JSON."""
+        record = logging.LogRecord("app", logging.WARNING, __file__, 1, 'said "%s"\nbye', ("hi",), None)
+        payload = json.loads(JSONFormatter().format(record))
+        assert payload["level"] == "WARNING"
+        assert payload["logger"] == "app"
+        assert payload["message"] == 'said "hi"\nbye'
+        assert "timestamp" in payload
+
+
+class TestGetFormatter:
+    """Test cases for the shared formatter cache."""
+
+    def test_reuses_one_formatter_per_format(self):
+        """Test that repeated lookups return the same instance."""
+        first = LogConfig.get_formatter(LogConfig.DEFAULT_FORMAT)
+        assert LogConfig.get_formatter(LogConfig.DEFAULT_FORMAT) is first
+        assert isinstance(LogConfig.get_formatter(LogConfig.JSON_FORMAT), JSONFormatter)
+
+
+class TestQueuedExceptionLogging:
+    """Test cases for exceptions logged through the queue handler chain."""
+
+    def _log_exception(self, formatter: logging.Formatter) -> str:
+        stream = io.StringIO()
+        output = logging.StreamHandler(stream)
+        output.setFormatter(formatter)
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+        logger = logging.getLogger("tests.queued_exception")
+        handler = _ExceptionPreservingQueueHandler(log_queue)
+        logger.addHandler(handler)
+        logger.propagate = False
+        listener.start()
+        try:
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.exception("failed for %s", "doc.pdf")
+        finally:
+            listener.stop()
+            logger.removeHandler(handler)
+            logger.propagate = True
+        return stream.getvalue()
+
+    def test_json_output_keeps_exception_field(self):
+        """Test that the traceback lands under "exception", not inside "message"."""
+        payload = json.loads(self._log_exception(JSONFormatter()))
+        assert payload["message"] == "failed for doc.pdf"
+        assert "ValueError: boom" in payload["exception"]
+
+    def test_text_output_appends_traceback_once(self):
+        """Test that the plain formatter still prints the traceback after the message."""
+        output = self._log_exception(logging.Formatter("%(message)s"))
+        assert output.startswith("failed for doc.pdf\nTraceback")
+        assert output.count("ValueError: boom") == 1
@@ -0,0 +1,142 @@
+"""
+Unit tests for the unified MIME type detector.
+"""
+
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from convert.utils import mime_detector
+from convert.utils.mime_detector import (
+    MIME_TYPE_MAPPINGS,
+    OLE2_MIME_TYPE,
+    OLE2_SIGNATURE,
+    MimeTypeDetector,
+    _sniff_mime_type,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
+
+
+class TestDetectFromExtension:
+    """Test cases for extension-based MIME detection."""
+
+    @pytest.mark.parametrize("filename, expected", [
+        ("report.PDF", "application/pdf"),
+        ("/tmp/uploads/sheet.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+        ("C:\\docs\\notes.md", "text/markdown"),
+        (".tex", "application/x-tex"),
+        ("archive.v2.zip", "application/zip"),
+    ])
+    def test_known_extensions(self, filename: str, expected: str):
+        """Test that paths and mixed-case extensions resolve to the mapped type."""
+        assert MimeTypeDetector().detect_from_extension(filename) == expected
+
+    @pytest.mark.parametrize("filename", ["", "README", "/tmp/dir.d/noext", "file.unknownext"])
+    def test_unknown_or_missing_extension(self, filename: str):
+        """Test that names without a recognised extension return None."""
+        assert MimeTypeDetector().detect_from_extension(filename) is None
+
+
+class TestGetMimeType:
+    """Test cases for the combined detection pipeline."""
+
+    def test_fallbacks_without_content(self):
+        """Test the extension, mapping and generic fallbacks, including repeat (cached) calls."""
+        detector = MimeTypeDetector()
+        for _ in range(2):
+            assert detector.get_mime_type(filename="deck.pptx") == MIME_TYPE_MAPPINGS["pptx"]
+            assert detector.get_mime_type(extension="csv") == "text/csv"
+            assert detector.get_mime_type(filename="noext", expected_format="md") == "text/markdown"
+            assert detector.get_mime_type(expected_format="foo") == "application/foo"
+            assert detector.get_mime_type() == "application/octet-stream"
+
+    def test_batch_matches_single_calls(self):
+        """Test that batch detection returns the same types as individual calls."""
+        detector = MimeTypeDetector()
+        items = [
+            (b"%PDF-1.4", "upload.bin", None, None),
+            (None, "deck.pptx", None, None),
+            (None, None, "csv", None),
+            (b"", "noext", None, "md"),
+            (None, None, None, None),
+        ]
+        expected = [detector.get_mime_type(*item) for item in items]
+        assert detector.get_mime_types_batch(items) == expected
+        assert expected[0] == "application/pdf"
+
+    def test_format_from_mime_type_ignores_parameters(self):
+        """Test that charset and case do not affect the reverse lookup."""
+        assert MimeTypeDetector().get_format_from_mime_type("Application/PDF; version=1.7") == "pdf"
+
+    @pytest.mark.parametrize("mime_type, expected", [
+        ("text/html", "html"),
+        ("image/jpeg", "jpg"),
+        ("image/tiff", "tiff"),
+    ])
+    def test_shared_mime_types_prefer_first_extension(self, mime_type: str, expected: str):
+        """Test that MIME types shared by several extensions map to the first listed one."""
+        assert MimeTypeDetector().get_format_from_mime_type(mime_type) == expected
+
+
+def _zip_bytes(entries) -> bytes:
+    """Build an in-memory zip from (name, data, compress_type) entries."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data, compress_type in entries:
+            archive.writestr(name, data, compress_type=compress_type)
+    return buffer.getvalue()
+
+
+class TestSniffMimeType:
+    """Test cases for the signature fast path."""
+
+    @pytest.mark.parametrize("content, expected", [
+        (b"%PDF-1.7\n...", "application/pdf"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00", "image/png"),
+        (b"{\\rtf1\\ansi", "application/rtf"),
+        (b"\xef\xbb\xbf\n  <!DOCTYPE html><html>", "text/html"),
+    ])
+    def test_common_signatures(self, content: bytes, expected: str):
+        """Test that common formats are recognised from their first bytes."""
+        assert _sniff_mime_type(content) == expected
+
+    def test_distinguishes_office_zip_containers(self):
+        """Test that OOXML and ODF packages are told apart from plain zips."""
+        docx = _zip_bytes([
+            ("[Content_Types].xml", "<Types/>", zipfile.ZIP_DEFLATED),
+            ("word/document.xml", "<w:document/>", zipfile.ZIP_DEFLATED),
+        ])
+        odt = _zip_bytes([
+            ("mimetype", "application/vnd.oasis.opendocument.text", zipfile.ZIP_STORED),
+            ("content.xml", "<office:document-content/>", zipfile.ZIP_DEFLATED),
+        ])
+        plain = _zip_bytes([("notes.txt", "hello", zipfile.ZIP_DEFLATED)])
+
+        assert _sniff_mime_type(docx) == MIME_TYPE_MAPPINGS["docx"]
+        assert _sniff_mime_type(odt) == "application/vnd.oasis.opendocument.text"
+        assert _sniff_mime_type(plain) == "application/zip"
+
+    @pytest.mark.parametrize("fixture, fmt", [("sample.xls", "xls"), ("sample.ppt", "ppt")])
+    def test_legacy_office_files(self, fixture: str, fmt: str):
+        """Test that OLE2 files are not all reported as Word documents."""
+        content = (FIXTURES_DIR / fixture).read_bytes()
+        detector = MimeTypeDetector()
+
+        assert detector.get_mime_type(content=content, expected_format=fmt) == MIME_TYPE_MAPPINGS[fmt]
+        assert detector.get_mime_type(content=content, filename=fixture) == MIME_TYPE_MAPPINGS[fmt]
+
+    def test_ole2_without_libmagic_is_generic(self, monkeypatch):
+        """Test that OLE2 content falls back to the container type when libmagic is unavailable."""
+        monkeypatch.setattr(mime_detector, "_get_magic", lambda: None)
+        content = OLE2_SIGNATURE + b"\x00" * 504
+
+        assert _sniff_mime_type(content) == OLE2_MIME_TYPE
+        assert MimeTypeDetector().get_mime_type(content=content, expected_format="xls") == MIME_TYPE_MAPPINGS["xls"]
+
+    def test_ignores_markers_inside_entry_data(self):
+        """Test that only entry names, not stored file data, identify OOXML parts."""
+        archive = _zip_bytes([("notes.txt", "see xl/ and word/ folders", zipfile.ZIP_STORED)])
+        assert _sniff_mime_type(archive) == "application/zip"
@@ -0,0 +1,31 @@
+"""
+Unit tests for the special conversion handlers.
+"""
+
+import tempfile
+
+from convert.utils import special_handlers
+from convert.utils.special_handlers import TempFileUpload
+
+
+class TestTempFileUpload:
+    """Test cases for the disk-backed upload wrapper."""
+
+    async def test_reads_and_iterates_from_file(self, monkeypatch):
+        """Test that content is read from the file, honouring seek and chunking."""
+        monkeypatch.setattr(special_handlers, "TEMP_UPLOAD_CHUNK_SIZE", 4)
+        spool = tempfile.SpooledTemporaryFile()
+        spool.write(b"0123456789")
+        spool.seek(0)
+
+        upload = TempFileUpload(spool, "converted.pptx")
+        try:
+            assert await upload.read(3) == b"012"
+            await upload.seek(0)
+            assert await upload.read() == b"0123456789"
+            await upload.seek(0)
+            assert [chunk async for chunk in upload] == [b"0123", b"4567", b"89"]
+        finally:
+            upload.close()
+        assert upload.filename == "converted.pptx"
+        assert spool.closed
@@ -0,0 +1,333 @@
+"""
+Unit tests for the centralized temporary file manager.
+"""
+
+import errno
+import gc
+import os
+import shutil
+import weakref
+
+from convert.utils.temp_file_manager import (
+    DEDUP_MIN_SIZE,
+    TempFileManager,
+    cleanup_temp_files,
+    cleanup_temp_files_async,
+    get_temp_manager,
+)
+
+
+class TestCreateTempFile:
+    """Test cases for creating managed temp files."""
+
+    async def test_async_create_writes_and_tracks_file(self, tmp_path):
+        """Test that the async variant writes the content and registers the file for cleanup."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+
+        temp_file = await manager.create_temp_file_async(b"payload", extension="pdf", prefix="job")
+
+        shard_dir = os.path.dirname(temp_file.path)
+        assert os.path.dirname(os.path.dirname(shard_dir)) == str(tmp_path / "conversion")
+        assert os.path.basename(temp_file.path).startswith("job_")
+        assert temp_file.path.endswith(".pdf")
+        with open(temp_file.path, "rb") as f:
+            assert f.read() == b"payload"
+        assert list(manager.temp_files) == [temp_file.path]
+
+        await manager.cleanup_all_async()
+        assert not os.path.exists(temp_file.path)
+
+
+class TestShardDirectories:
+    """Test cases for the hashed shard subdirectories."""
+
+    def test_recreates_shard_removed_externally(self, tmp_path):
+        """Test that writes and copies succeed after a tmp cleaner deletes the service tree."""
+        manager = TempFileManager(base_dir=str(tmp_path / "temp"), service="conversion")
+        manager.create_temp_file(b"first", filename="doc.txt")
+        source = tmp_path / "source.txt"
+        source.write_bytes(b"copied")
+        shutil.rmtree(tmp_path / "temp" / "conversion")
+
+        rewritten = manager.create_temp_file(b"second", filename="doc.txt")
+        shutil.rmtree(tmp_path / "temp" / "conversion")
+        copied = manager.copy_to_temp(source, filename="doc.txt")
+
+        assert rewritten.path == copied.path
+        with open(copied.path, "rb") as f:
+            assert f.read() == b"copied"
+
+
+    def test_empty_shards_are_removed_on_cleanup(self, tmp_path):
+        """Test that cleanup removes emptied shard directories but keeps occupied ones."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        service_dir = tmp_path / "conversion"
+        kept = manager.create_temp_file(b"kept", filename="kept.txt")
+        removed = manager.create_temp_file(b"gone", filename="gone.txt")
+        assert os.path.dirname(kept.path) != os.path.dirname(removed.path)
+
+        manager.cleanup_file(removed.path)
+
+        assert os.path.isdir(os.path.dirname(kept.path))
+        assert not os.path.exists(os.path.dirname(removed.path))
+        for name in ("a.txt", "b.txt", "c.txt"):
+            manager.create_temp_file(b"x", filename=name)
+        manager.cleanup_all()
+        assert [p.name for p in service_dir.iterdir()] == []
+
+    async def test_async_cleanup_removes_empty_shards(self, tmp_path):
+        """Test that the async cleanups leave no empty shard directories behind."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        service_dir = tmp_path / "conversion"
+        first = await manager.create_temp_file_async(b"one", filename="one.txt")
+        await manager.create_temp_file_async(b"two", filename="two.txt")
+
+        await manager.cleanup_file_async(first.path)
+        assert not os.path.exists(os.path.dirname(first.path))
+        await manager.cleanup_all_async()
+
+        assert [p.name for p in service_dir.iterdir()] == []
+        # A later write recreates its shard
+        again = await manager.create_temp_file_async(b"one", filename="one.txt")
+        with open(again.path, "rb") as f:
+            assert f.read() == b"one"
+
+
+class TestCleanupTempFilesAsync:
+    """Test cases for concurrent temp file removal."""
+
+    async def test_removes_all_files_and_ignores_missing(self, tmp_path):
+        """Test that every path is removed across worker batches and missing files are skipped."""
+        paths = []
+        for i in range(20):
+            path = tmp_path / f"file_{i}.tmp"
+            path.write_bytes(b"x")
+            paths.append(str(path))
+        paths.append(str(tmp_path / "already_gone.tmp"))
+
+        await cleanup_temp_files_async(paths)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestCleanupFile:
+    """Test cases for cleaning up individual managed files."""
+
+    def test_removes_only_the_given_file(self, tmp_path):
+        """Test that one file is deleted and untracked while the others stay managed."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        keep = manager.create_temp_file(b"keep", extension="txt")
+        drop = manager.create_temp_file(b"drop", extension="txt")
+
+        manager.cleanup_file(drop.path)
+
+        assert not os.path.exists(drop.path)
+        assert os.path.exists(keep.path)
+        assert list(manager.temp_files) == [keep.path]
+        stats = manager.get_stats()
+        assert stats["file_count"] == 1
+        assert stats["total_size_bytes"] == 4
+
+
+class TestGetStats:
+    """Test cases for manager statistics."""
+
+    def test_totals_sharded_and_external_files(self, tmp_path):
+        """Test that sizes are summed for files in shards and files added from elsewhere."""
+        manager = TempFileManager(base_dir=str(tmp_path / "temp"), service="conversion")
+        for i in range(5):
+            manager.create_temp_file(b"x" * 10, filename=f"file_{i}.txt")
+        external = tmp_path / "external.bin"
+        external.write_bytes(b"y" * 7)
+        manager.add_existing_file(str(external))
+        missing = manager.create_temp_file(b"z" * 100, filename="missing.txt")
+        os.remove(missing.path)
+
+        stats = manager.get_stats()
+
+        assert stats["file_count"] == 7
+        assert stats["total_size_bytes"] == 57
+
+
+class TestFinalizer:
+    """Test cases for cleanup when a manager is garbage collected."""
+
+    def test_manager_is_collected_and_files_removed(self, tmp_path):
+        """Test that the finalizer does not keep the manager alive and still cleans up."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        path = manager.create_temp_file(b"data", extension="txt").path
+        manager_ref = weakref.ref(manager)
+
+        del manager
+        gc.collect()
+
+        assert manager_ref() is None
+        assert not os.path.exists(path)
+
+
+class TestGetTempManager:
+    """Test cases for the shared manager registry."""
+
+    def test_pinned_manager_is_reused(self, tmp_path):
+        """Test that pinned managers are returned again for the same service and directory."""
+        manager = get_temp_manager("conversion", str(tmp_path))
+        manager_ref = weakref.ref(manager)
+
+        del manager
+        gc.collect()
+
+        assert manager_ref() is get_temp_manager("conversion", str(tmp_path))
+
+    def test_unpinned_manager_is_collected(self, tmp_path):
+        """Test that an unpinned manager is dropped from the registry once unreferenced."""
+        manager = get_temp_manager("conversion", str(tmp_path), pin=False)
+        assert get_temp_manager("conversion", str(tmp_path), pin=False) is manager
+        manager_ref = weakref.ref(manager)
+
+        del manager
+        gc.collect()
+
+        assert manager_ref() is None
+
+
+class TestCopyToTemp:
+    """Test cases for copying existing files into the temp directory."""
+
+    def test_copies_content_and_mtime(self, tmp_path):
+        """Test that data and modification time are preserved, as with shutil.copy2."""
+        source = tmp_path / "source.docx"
+        source.write_bytes(b"0123456789" * 1000)
+        os.utime(source, (1_600_000_000, 1_600_000_000))
+        manager = TempFileManager(base_dir=str(tmp_path / "temp"), service="conversion")
+
+        temp_file = manager.copy_to_temp(source, filename="copy.docx")
+
+        with open(temp_file.path, "rb") as f:
+            assert f.read() == source.read_bytes()
+        assert os.stat(temp_file.path).st_mtime == 1_600_000_000
+
+
+class TestContentDeduplication:
+    """Test cases for hardlink-based reuse of identical content."""
+
+    def test_identical_large_content_shares_one_blob(self, tmp_path):
+        """Test that repeated payloads are linked to one blob and cleaned up with the manager."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        content = b"x" * DEDUP_MIN_SIZE
+
+        first = manager.create_temp_file(content, extension="pdf")
+        second = manager.create_temp_file(content, extension="pdf")
+
+        assert os.stat(first.path).st_ino == os.stat(second.path).st_ino
+        with open(second.path, "rb") as f:
+            assert f.read() == content
+        stats = manager.get_stats()
+        assert (stats["dedup_hits"], stats["dedup_misses"]) == (1, 1)
+
+        manager.cleanup_all()
+        assert [p for p in (tmp_path / "conversion").rglob("*") if p.is_file()] == []
+
+    def test_overwriting_a_linked_path_leaves_other_links_intact(self, tmp_path):
+        """Test that rewriting a deduplicated file does not change the blob or its other links."""
+        manager = TempFileManager(base_dir=str(tmp_path / "temp"), service="conversion")
+        content = b"y" * (DEDUP_MIN_SIZE + 100)
+        manager.create_temp_file(content, filename="a.bin")
+        other = manager.create_temp_file(content, filename="b.bin")
+        source = tmp_path / "replacement.bin"
+        source.write_bytes(b"copied")
+
+        rewritten = manager.create_temp_file(b"tiny", filename="a.bin")
+        copied = manager.copy_to_temp(source, filename="b.bin")
+        reused = manager.create_temp_file(content, filename="c.bin")
+
+        with open(rewritten.path, "rb") as f:
+            assert f.read() == b"tiny"
+        with open(copied.path, "rb") as f:
+            assert f.read() == b"copied"
+        assert other.path == copied.path
+        with open(reused.path, "rb") as f:
+            assert f.read() == content
+
+    def test_blob_is_deleted_with_its_last_link(self, tmp_path):
+        """Test that a blob is removed once every file linked to it is cleaned up."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        content = b"z" * DEDUP_MIN_SIZE
+        first = manager.create_temp_file(content, extension="pdf")
+        second = manager.create_temp_file(content, extension="pdf")
+        blob_dir = tmp_path / "conversion" / ".blobs"
+
+        manager.cleanup_file(first.path)
+        assert len(list(blob_dir.iterdir())) == 1
+
+        manager.cleanup_file(second.path)
+        assert list(blob_dir.iterdir()) == []
+
+    def test_blobs_are_bounded_by_total_size(self, tmp_path):
+        """Test that the least recently used blobs are evicted beyond the byte budget."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        manager._content_store.max_bytes = 2 * DEDUP_MIN_SIZE
+
+        for fill in (b"a", b"b", b"c"):
+            manager.create_temp_file(fill * DEDUP_MIN_SIZE, extension="bin", auto_cleanup=False)
+
+        assert len(list((tmp_path / "conversion" / ".blobs").iterdir())) == 2
+
+    def test_finalizer_removes_blobs(self, tmp_path):
+        """Test that collecting a manager deletes its blob store as well as its files."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        manager.create_temp_file(b"w" * DEDUP_MIN_SIZE, extension="pdf")
+
+        del manager
+        gc.collect()
+
+        assert [p for p in (tmp_path / "conversion").rglob("*") if p.is_file()] == []
+
+    def test_falls_back_to_plain_writes_without_hardlinks(self, tmp_path, monkeypatch):
+        """Test that filesystems rejecting os.link still get the content and keep no blobs."""
+        def refuse_link(src, dst):
+            raise PermissionError(errno.EPERM, "Operation not permitted")
+
+        monkeypatch.setattr(os, "link", refuse_link)
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        content = b"p" * DEDUP_MIN_SIZE
+
+        first = manager.create_temp_file(content, extension="pdf")
+        second = manager.create_temp_file(content, extension="pdf")
+
+        for temp_file in (first, second):
+            with open(temp_file.path, "rb") as f:
+                assert f.read() == content
+        assert not manager._content_store.links_supported
+        assert list((tmp_path / "conversion" / ".blobs").iterdir()) == []
+
+    def test_orphaned_blobs_are_evicted_before_live_ones(self, tmp_path):
+        """Test that blobs of files deleted outside the manager are dropped first when over budget."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+        manager._content_store.max_blobs = 2
+        live = manager.create_temp_file(b"a" * DEDUP_MIN_SIZE, extension="bin")
+        removed = manager.create_temp_file(b"b" * DEDUP_MIN_SIZE, extension="bin")
+        os.remove(removed.path)
+
+        manager.create_temp_file(b"c" * DEDUP_MIN_SIZE, extension="bin")
+        reused = manager.create_temp_file(b"a" * DEDUP_MIN_SIZE, extension="bin")
+
+        assert os.stat(reused.path).st_ino == os.stat(live.path).st_ino
+        assert len(list((tmp_path / "conversion" / ".blobs").iterdir())) == 2
+
+    def test_module_cleanup_releases_blobs(self, tmp_path):
+        """Test that cleanup_temp_files also frees the blobs of registered managers."""
+        manager = get_temp_manager("conversion", str(tmp_path), pin=False)
+        temp_file = manager.create_temp_file(b"m" * DEDUP_MIN_SIZE, extension="bin")
+
+        cleanup_temp_files([temp_file.path])
+
+        assert list((tmp_path / "conversion" / ".blobs").iterdir()) == []
+
+    def test_small_content_is_written_directly(self, tmp_path):
+        """Test that payloads below the threshold bypass the blob store."""
+        manager = TempFileManager(base_dir=str(tmp_path), service="conversion")
+
+        temp_file = manager.create_temp_file(b"small")
+
+        assert os.stat(temp_file.path).st_nlink == 1
+        assert manager.get_stats()["dedup_misses"] == 0
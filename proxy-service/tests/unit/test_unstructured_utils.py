@@ -0,0 +1,96 @@
+"""
+Unit tests for unstructured-io data processing utilities.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from convert.utils import unstructured_utils
+from convert.utils.unstructured_utils import (
+    _AsyncByteReader,
+    _stream_unstructured_elements,
+    process_unstructured_json_to_content,
+)
+
+
+class TestProcessUnstructuredJsonToHtml:
+    """Test cases for rendering unstructured-io elements as HTML."""
+
+    def test_wraps_tables_and_paragraphs_in_document(self, monkeypatch):
+        """Test that tables keep their markup, text becomes paragraphs and empty text is skipped."""
+        elements = [
+            SimpleNamespace(text="Title", text_as_html=None),
+            SimpleNamespace(text="a b", text_as_html="<table><tr><td>a</td><td>b</td></tr></table>"),
+            SimpleNamespace(text=""),
+            SimpleNamespace(text=None),
+        ]
+        monkeypatch.setattr(unstructured_utils, "UNSTRUCTURED_AVAILABLE", True)
+        monkeypatch.setattr(unstructured_utils, "dict_to_elements", lambda data: elements)
+
+        html = process_unstructured_json_to_content([], "html", fix_tables=False)
+
+        assert html == (
+            "<!DOCTYPE html>\n<html>\n<head>\n<title>Converted Document</title>\n</head>\n<body>\n"
+            "<p>Title</p>\n"
+            "<table><tr><td>a</td><td>b</td></tr></table>\n"
+            "</body>\n</html>"
+        )
+
+
+class TestAsyncByteReader:
+    """Test cases for adapting a response byte stream for ijson."""
+
+    async def test_returns_chunks_then_empty_bytes(self):
+        """Test that reads yield each chunk, then b"", and record the first non-blank byte."""
+        async def chunks():
+            yield b"  \n"
+            yield b'[{"a": 1},'
+            yield b'{"b": 2}]'
+
+        reader = _AsyncByteReader(chunks())
+
+        assert await reader.read(65536) == b"  \n"
+        assert reader.first_byte is None
+        assert await reader.read(65536) == b'[{"a": 1},'
+        assert reader.first_byte == b"["
+        assert await reader.read(65536) == b'{"b": 2}]'
+        assert await reader.read(65536) == b""
+
+
+    async def test_feeds_ijson_across_chunks(self):
+        """Test that ijson's read(0) type probe consumes nothing and all chunks are parsed."""
+        ijson = pytest.importorskip("ijson")
+
+        async def chunks():
+            yield b'[{"text": "a"},'
+            yield b' {"text": '
+            yield b'"b"}]'
+
+        reader = _AsyncByteReader(chunks())
+        items = [item async for item in ijson.items_async(reader, "item")]
+
+        assert items == [{"text": "a"}, {"text": "b"}]
+        assert reader.first_byte == b"["
+
+class TestStreamUnstructuredElements:
+    """Test cases for incrementally parsed unstructured-io responses."""
+
+    async def _stream(self, body: bytes) -> list:
+        pytest.importorskip("ijson")
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await _stream_unstructured_elements(client, "http://unstructured/general", {}, {})
+
+    async def test_parses_element_array(self):
+        """Test that elements are decoded from a top-level array."""
+        assert await self._stream(b'[{"text": "a"}, {"text": "b"}]') == [{"text": "a"}, {"text": "b"}]
+
+    async def test_rejects_non_array_body(self):
+        """Test that an error object sent with status 200 fails instead of yielding no elements."""
+        with pytest.raises(HTTPException) as exc_info:
+            await self._stream(b'{"detail": "model not loaded"}')
+
+        assert exc_info.value.status_code == 502